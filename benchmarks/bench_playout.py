@@ -0,0 +1,54 @@
+"""Benchmark: playouts/sec of the flat kernel against the GameState/Action path.
+
+    PYTHONPATH=src python benchmarks/bench_playout.py --games 2000
+"""
+
+import argparse
+import random
+import time
+from warchest.agents import GreedyAgent, RandomAgent
+from warchest.core.game_state import GameState
+from warchest.core.playout import FlatState, PlayoutBuffer, Policy, playout
+
+AGENTS = {Policy.RANDOM: RandomAgent, Policy.GREEDY: GreedyAgent}
+
+
+def bench_objects(start: GameState, games: int, policy: Policy) -> float:
+    """Playouts/sec through legal_actions / is_valid / Board.move_token."""
+    t0 = time.perf_counter()
+    for seed in range(games):
+        gs = start.copy()
+        agent = AGENTS[policy](seed)
+        while not gs.is_over():
+            gs.apply(agent.choose_action(gs))
+    return games / (time.perf_counter() - t0)
+
+
+def bench_kernel(start: GameState, games: int, policy: Policy) -> float:
+    """Playouts/sec through the flat kernel with one reused buffer."""
+    state = FlatState.from_game(start)
+    buf = PlayoutBuffer.for_state(state)
+    t0 = time.perf_counter()
+    for seed in range(games):
+        playout(state, random.Random(seed), buf, policy)
+    return games / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--max-turns", type=int, default=200)
+    args = parser.parse_args()
+
+    start = GameState(max_turns=args.max_turns)
+    for policy in Policy:
+        obj = bench_objects(start, max(1, args.games // 10), policy)
+        flat = bench_kernel(start, args.games, policy)
+        print(
+            f"{policy.name:<7} objects {obj:9.1f} playouts/s   "
+            f"kernel {flat:9.1f} playouts/s   speedup {flat / obj:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: verifying archived games, one action at a time vs apply_batch.
+
+    PYTHONPATH=src python benchmarks/bench_replay.py --games 500
+"""
+
+import argparse
+import time
+from warchest.agents import RandomAgent
+from warchest.core.enums import ActionStatus
+from warchest.core.game_state import apply_batch
+from warchest.core.records import GameRecord
+from warchest.tournament import self_play
+
+
+def verify_single(records: list[GameRecord]) -> int:
+    """Return the number of plies checked with is_valid + GameState.apply."""
+    plies = 0
+    for record in records:
+        gs = record.new_game()
+        for action in record.actions(gs):
+            if gs.is_over() or not action.is_valid(gs):
+                raise AssertionError("archived game does not replay")
+            gs.apply(action)
+            plies += 1
+    return plies
+
+
+def verify_batch(records: list[GameRecord], transactional: bool) -> int:
+    """Return the number of plies checked with apply_batch."""
+    plies = 0
+    for record in records:
+        gs = record.new_game()
+        statuses = apply_batch(gs, record.actions(gs), transactional=transactional)
+        if any(status is not ActionStatus.OK for status in statuses):
+            raise AssertionError("archived game does not replay")
+        plies += len(statuses)
+    return plies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--max-turns", type=int, default=200)
+    args = parser.parse_args()
+
+    records = list(self_play(RandomAgent, RandomAgent, args.games, max_turns=args.max_turns))
+    runs = [
+        ("single", lambda: verify_single(records)),
+        ("batch", lambda: verify_batch(records, False)),
+        ("batch/transactional", lambda: verify_batch(records, True)),
+    ]
+    base = None
+    for name, run in runs:
+        t0 = time.perf_counter()
+        plies = run()
+        elapsed = time.perf_counter() - t0
+        base = base or elapsed
+        print(
+            f"{name:<20} {len(records) / elapsed:9.1f} games/s  {plies / elapsed:11.0f} plies/s"
+            f"   speedup {base / elapsed:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
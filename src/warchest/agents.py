@@ -0,0 +1,47 @@
+"""Simple bot agents. Any object with a choose_action(game_state) method can play."""
+
+import random
+from typing import Optional, Protocol
+from warchest.core.action import Action, MoveAction
+from warchest.core.game_state import PLAYER_CONTROL, GameState
+
+
+class Agent(Protocol):
+    """The interface the tournament runner (and anything else) drives agents through."""
+
+    def choose_action(self, game_state: GameState) -> Action:
+        """Return the action to play in the given state."""
+        ...
+
+
+class RandomAgent:
+    """Plays a uniformly random legal action."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.rng = random.Random(seed)
+
+    def choose_action(self, game_state: GameState) -> Action:
+        actions = game_state.legal_actions()
+        return actions[self.rng.randrange(len(actions))]
+
+
+class GreedyAgent:
+    """Takes a control point it does not hold when it can, otherwise plays randomly."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.rng = random.Random(seed)
+
+    def choose_action(self, game_state: GameState) -> Action:
+        actions = game_state.legal_actions()
+        mine = PLAYER_CONTROL[game_state.get_current_player()]
+        board = game_state.board
+        captures = [
+            a
+            for a in actions
+            if isinstance(a, MoveAction)
+            and game_state.is_control_point(a.to_hex)
+            and board.control_of(a.to_hex) is not mine
+        ]
+        if captures:
+            return captures[self.rng.randrange(len(captures))]
+        return actions[self.rng.randrange(len(actions))]
@@ -52,7 +52,10 @@ class MoveAction(Action):
             return False
 
         # check if token is at the place the token is the same as the resource
-        if game_state.board.get_token_at(self.from_hex) != self.resource:
+        if not game_state.board.in_bounds(self.from_hex):
+            return False
+        token = game_state.board.get_token_at(self.from_hex)
+        if token is None or token != self.resource:
             return False
 
         # check if resource is in player's hand
@@ -63,8 +66,24 @@ class MoveAction(Action):
         if self.from_hex.distance(self.to_hex) != 1:  # move distance is 1
             return False
 
+        # check destination is on the board and empty
+        if not game_state.board.in_bounds(self.to_hex):
+            return False
+        if game_state.board.get_token_at(self.to_hex) is not None:
+            return False
+
         return True
 
     def apply(self, game_state):
         # Move the token on the board
         game_state.board.move_token(self.from_hex, self.to_hex)
+
+    def __repr__(self) -> str:
+        return f"MoveAction({self.player.name}, {self.from_hex} -> {self.to_hex})"
+
+
+class PassAction(Action):
+    """Class to represent giving up the rest of the turn."""
+
+    def __repr__(self) -> str:
+        return f"PassAction({self.player.name})"
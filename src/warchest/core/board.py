@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, Mapping, Union, Sequence, Iterable, FrozenSet, ClassVar
 from collections import defaultdict
+from functools import lru_cache
 from warchest.core.enums import Control
 from warchest.core.hex import Hex
 from warchest.core.tokens import Token
@@ -30,6 +31,39 @@ NeutralLocations: frozenset[Hex] = frozenset(
 )
 
 
+# --------------------------------------------------------------------------- #
+# dense indexing
+# Hexes of a layout are numbered 0..n-1 in (q, r) order so that per-hex data
+# can be kept in flat arrays; neighbour lists follow Hex._DIRECTIONS order.
+# --------------------------------------------------------------------------- #
+UNREACHABLE = 255  # distance-field value for hexes that cannot be reached
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutIndex:
+    """Dense numbering of a layout and its precomputed adjacency."""
+
+    hexes: tuple[Hex, ...]
+    index: Mapping[Hex, int]
+    neighbours: tuple[tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def layout_index(layout: FrozenSet[Hex]) -> LayoutIndex:
+    """Return the (cached) dense index of a layout."""
+    hexes = tuple(sorted(layout, key=lambda hx: (hx.q, hx.r)))
+    index = {hx: i for i, hx in enumerate(hexes)}
+    neighbours = tuple(
+        tuple(
+            index[nb]
+            for nb in (Hex(hx.q + dq, hx.r + dr) for dq, dr in Hex._DIRECTIONS.values())
+            if nb in index
+        )
+        for hx in hexes
+    )
+    return LayoutIndex(hexes, index, neighbours)
+
+
 # --------------------------------------------------------------------------- #
 # payload container
 # --------------------------------------------------------------------------- #
@@ -62,9 +96,12 @@ class Cell:
 class Board:
     """Keeps board geometry **and** per-hex contents/status."""
 
-    __slots__ = ("_layout", "_map")  # layout is the set of valid hexes; map is Hex -> Cell
+    # layout is the set of valid hexes; map is Hex -> Cell;
+    # fields caches distance fields keyed on (sources, max_distance)
+    __slots__ = ("_layout", "_map", "_fields")
 
     DefaultLayout: ClassVar[FrozenSet[Hex]] = BoardHexes
+    MaxCachedFields: ClassVar[int] = 64  # distance fields kept per board (LRU)
 
     def __init__(
         self,
@@ -81,6 +118,7 @@ class Board:
 
         # 2 map  Hex → Cell
         self._map: dict[Hex, Cell] = defaultdict(Cell)
+        self._fields: dict[tuple[FrozenSet[Hex], int], bytes] = {}
 
         # 3 load token stacks
         if initial:
@@ -108,6 +146,11 @@ class Board:
     # ------------------------------------------------------------------ #
     # Public helpers
     # ------------------------------------------------------------------ #
+    @property
+    def layout(self) -> FrozenSet[Hex]:
+        """Return the set of valid hexes for this board."""
+        return self._layout
+
     def get_token_at(self, hx: Hex) -> Optional["Token"]:
         """Return the top token at the given hex, or None if empty."""
         self._ensure_in_bounds(hx)
@@ -129,11 +172,16 @@ class Board:
         to_cell = self._map[to_hx]
         to_cell.stack.extend(from_cell.stack)
         from_cell.stack.clear()
+        self._occupancy_changed(from_hx)
+        self._occupancy_changed(to_hx)
 
     def place(self, hx: Hex, token: "Token") -> None:
         """Place a token on top of the stack at the given hex."""
         self._ensure_in_bounds(hx)
-        self._map[hx].stack.append(token)
+        stack = self._map[hx].stack
+        stack.append(token)
+        if len(stack) == 1:
+            self._occupancy_changed(hx)
 
     def remove_top(self, hx: Hex) -> "Token":
         """Remove and return the top token from the stack at the given hex."""
@@ -142,11 +190,32 @@ class Board:
         if not cell.stack:
             raise ValueError(f"No tokens at {hx}")
         top = cell.stack.pop()
-        if not cell.stack and cell.control is Control.NEUTRAL:
-            # keep map small: remove empty neutral cells
-            self._map.pop(hx, None)
+        if not cell.stack:
+            self._occupancy_changed(hx)
+            if cell.control is Control.NEUTRAL:
+                # keep map small: remove empty neutral cells
+                self._map.pop(hx, None)
         return top
 
+    def in_bounds(self, hx: Hex) -> bool:
+        """Return True if the hex is part of the board layout."""
+        return hx in self._layout
+
+    def copy(self) -> "Board":
+        """Return a copy of the board that shares tokens but not stacks."""
+        new = Board.__new__(Board)
+        new._layout = self._layout
+        new._map = defaultdict(Cell, {hx: cell.copy() for hx, cell in self._map.items()})
+        new._fields = dict(self._fields)  # fields are immutable bytes
+        return new
+
+    def restore(self, snapshot: "Board") -> None:
+        """Reset this board in place to the contents of a copy taken earlier."""
+        if snapshot._layout != self._layout:
+            raise ValueError("snapshot was taken from a board with a different layout")
+        self._map = defaultdict(Cell, {hx: cell.copy() for hx, cell in snapshot._map.items()})
+        self._fields = dict(snapshot._fields)
+
     def control_of(self, hx: Hex) -> Control:
         """Return the control status of the given hex."""
         self._ensure_in_bounds(hx)
@@ -157,6 +226,54 @@ class Board:
         self._ensure_in_bounds(hx)
         self._map[hx].control = ctrl
 
+    # ------------------------------------------------------------------ #
+    # Reachability queries
+    # ------------------------------------------------------------------ #
+    @property
+    def index(self) -> LayoutIndex:
+        """Return the dense hex numbering used by distance fields."""
+        return layout_index(self._layout)
+
+    def distance_field(self, sources: Iterable[Hex], max_distance: Optional[int] = None) -> bytes:
+        """
+        Return the number of single-hex moves from the nearest source to every hex.
+
+        The result is indexed by ``self.index`` and holds UNREACHABLE for hexes that
+        cannot be reached within max_distance. Occupied hexes are obstacles: they get
+        a distance (a unit there can be reached / threatened) but paths do not pass
+        through them. Sources are always expanded, occupied or not.
+        Results are cached until a move/place/remove changes the occupancy of a hex
+        the field depended on; at most MaxCachedFields are kept, least recently used
+        first out.
+        """
+        srcs = frozenset(sources)
+        for hx in srcs:
+            self._ensure_in_bounds(hx)
+        limit = UNREACHABLE - 1 if max_distance is None else min(max_distance, UNREACHABLE - 1)
+        if limit < 0:
+            raise ValueError("max_distance must be non-negative")
+        key = (srcs, limit)
+        fields = self._fields
+        field_ = fields.pop(key, None)  # re-inserted below to mark it most recent
+        if field_ is None:
+            field_ = self._bfs(srcs, limit)
+            if len(fields) >= self.MaxCachedFields:
+                del fields[next(iter(fields))]
+        fields[key] = field_
+        return field_
+
+    def within(self, sources: Iterable[Hex], k: int) -> FrozenSet[Hex]:
+        """Return all hexes reachable from any source in at most k moves."""
+        dist = self.distance_field(sources, k)
+        hexes = self.index.hexes
+        return frozenset(hexes[i] for i, d in enumerate(dist) if d != UNREACHABLE)
+
+    def distance(self, sources: Iterable[Hex], hx: Hex) -> Optional[int]:
+        """Return the move distance from the nearest source to hx, or None if unreachable."""
+        self._ensure_in_bounds(hx)
+        d = self.distance_field(sources)[self.index.index[hx]]
+        return None if d == UNREACHABLE else d
+
     # ------------------------------------------------------------------ #
     # Internal
     # ------------------------------------------------------------------ #
@@ -164,6 +281,40 @@ class Board:
         if hx not in self._layout:
             raise ValueError(f"{hx} is outside board bounds")
 
+    def _bfs(self, sources: FrozenSet[Hex], limit: int) -> bytes:
+        idx = self.index
+        dist = bytearray([UNREACHABLE]) * len(idx.hexes)
+        blocked = [False] * len(idx.hexes)
+        for hx, cell in self._map.items():
+            if cell.stack:
+                blocked[idx.index[hx]] = True
+        frontier = [idx.index[hx] for hx in sources]
+        for i in frontier:
+            dist[i] = 0
+        d = 0
+        while frontier and d < limit:
+            d += 1
+            nxt = []
+            for i in frontier:
+                if d > 1 and blocked[i]:
+                    continue
+                for j in idx.neighbours[i]:
+                    if dist[j] == UNREACHABLE:
+                        dist[j] = d
+                        nxt.append(j)
+            frontier = nxt
+        return bytes(dist)
+
+    def _occupancy_changed(self, hx: Hex) -> None:
+        """Drop cached fields that expanded through (or stopped at) hx."""
+        if not self._fields:
+            return
+        i = self.index.index[hx]
+        # a hex only matters to a field if the BFS reached it early enough to expand it
+        stale = [key for key, dist in self._fields.items() if 0 < dist[i] < key[1]]
+        for key in stale:
+            del self._fields[key]
+
     # ------------------------------------------------------------------ #
     # Iteration / len / repr for testing & debugging
     # ------------------------------------------------------------------ #
@@ -1,6 +1,6 @@
 """Enumerations for the game, including player identifiers, token types, and location types."""
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class Control(Enum):
@@ -33,3 +33,19 @@ class LocationType(Enum):
     DEAD = auto()
     BAG = auto()
     DISCARD = auto()
+
+
+class ActionStatus(IntEnum):
+    """Per-action result codes returned by apply_batch."""
+
+    OK = 0
+    GAME_OVER = auto()
+    WRONG_PLAYER = auto()
+    OFF_BOARD = auto()
+    TOKEN_MISMATCH = auto()  # from-hex is empty or holds a different token
+    NOT_MOVABLE = auto()  # token is not in hand or not owned by the player
+    BAD_DISTANCE = auto()
+    DESTINATION_OCCUPIED = auto()
+    INVALID = auto()  # rejected by is_valid of an action type without a fast path
+    ROLLED_BACK = auto()  # was applied, then undone by a failing transaction
+    SKIPPED = auto()  # not attempted because an earlier action failed the transaction
@@ -0,0 +1,259 @@
+"""Evaluation cache for board positions, folding the 180° player-swap symmetry."""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, FrozenSet, Optional
+from warchest.core.board import Board
+from warchest.core.enums import Control, Player
+from warchest.core.hex import Hex
+
+# --------------------------------------------------------------------------- #
+# position keys
+# --------------------------------------------------------------------------- #
+# a key is a sorted tuple of (q, r, control, ((token_type, owner), ...)) entries;
+# token ids are left out so that equivalent positions share one key
+
+PositionKey = tuple[tuple[int, int, int, tuple[tuple[int, int], ...]], ...]
+
+_SWAP_CONTROL = {Control.NEUTRAL: Control.NEUTRAL, Control.A: Control.B, Control.B: Control.A}
+_SWAP_PLAYER = {Player.A: Player.B, Player.B: Player.A}
+
+
+@lru_cache(maxsize=None)
+def _is_point_symmetric(layout: FrozenSet[Hex]) -> bool:
+    """True if the layout maps onto itself under a 180° rotation."""
+    return all(Hex(-hx.q, -hx.r) in layout for hx in layout)
+
+
+def position_key(board: Board) -> PositionKey:
+    """Return a hashable key describing the tokens and control on the board."""
+    entries = []
+    for hx, cell in board:
+        if not cell.stack and cell.control is Control.NEUTRAL:
+            continue
+        stack = tuple((tk.token_type.value, tk.owner.value) for tk in cell.stack)
+        entries.append((hx.q, hx.r, cell.control.value, stack))
+    entries.sort()
+    return tuple(entries)
+
+
+def mirrored_key(board: Board) -> PositionKey:
+    """Return the key of the board rotated by 180° with the players swapped."""
+    entries = []
+    for hx, cell in board:
+        if not cell.stack and cell.control is Control.NEUTRAL:
+            continue
+        stack = tuple((tk.token_type.value, _SWAP_PLAYER[tk.owner].value) for tk in cell.stack)
+        entries.append((-hx.q, -hx.r, _SWAP_CONTROL[cell.control].value, stack))
+    entries.sort()
+    return tuple(entries)
+
+
+def canonical_key(board: Board) -> tuple[PositionKey, bool]:
+    """
+    Return (key, flipped) where key is the same for a position and its mirror image.
+    flipped is True when the key was taken from the mirrored (player-swapped) position.
+    Boards whose layout is not point-symmetric are never flipped.
+    """
+    key = position_key(board)
+    if not _is_point_symmetric(board.layout):
+        return key, False
+    mirror = mirrored_key(board)
+    if mirror < key:
+        return mirror, True
+    return key, False
+
+
+def key_digest(key: PositionKey) -> int:
+    """Return a stable 64-bit digest of a position key (see opening_book.position_hash)."""
+    return int.from_bytes(hashlib.blake2b(repr(key).encode(), digest_size=8).digest(), "little")
+
+
+# --------------------------------------------------------------------------- #
+# cache
+# entries are keyed on the 64-bit digest of the canonical key, so each one costs
+# a fixed amount: an int key, a float value and its OrderedDict slot and node
+# (about 150 bytes on 64-bit CPython; rounded up to allow for table slack)
+# --------------------------------------------------------------------------- #
+ENTRY_BYTES = 192
+# --------------------------------------------------------------------------- #
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters reported by EvalCache.stats()."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    max_entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class EvalCache:
+    """
+    LRU cache of heuristic evaluations keyed on digests of canonical position keys.
+
+    The bound is given in bytes and converted to an entry count using ENTRY_BYTES.
+
+    Values are stored from Player.A's point of view. When a position is looked up
+    through its mirror image the stored value is negated, so evaluation functions
+    must be zero-sum (eval(mirror) == -eval(board)). Pass symmetric=False otherwise.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_max_bytes",
+        "_max_entries",
+        "_symmetric",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    def __init__(self, max_bytes: int = 16 << 20, *, symmetric: bool = True) -> None:
+        if max_bytes < ENTRY_BYTES:
+            raise ValueError(f"max_bytes must be at least {ENTRY_BYTES} (one entry)")
+        self._entries: OrderedDict[int, float] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._max_entries = max_bytes // ENTRY_BYTES
+        self._symmetric = symmetric
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------ #
+    # Public helpers
+    # ------------------------------------------------------------------ #
+    @property
+    def max_bytes(self) -> int:
+        """Memory bound the cache was created with."""
+        return self._max_bytes
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of entries kept before evicting (max_bytes // ENTRY_BYTES)."""
+        return self._max_entries
+
+    @property
+    def symmetric(self) -> bool:
+        """True if mirror-image positions share entries."""
+        return self._symmetric
+
+    def key_for(self, board: Board) -> tuple[int, bool]:
+        """Return the cache key (a 64-bit digest) for the board and whether it was flipped."""
+        if self._symmetric:
+            key, flipped = canonical_key(board)
+        else:
+            key, flipped = position_key(board), False
+        return key_digest(key), flipped
+
+    def get(self, board: Board) -> Optional[float]:
+        """Return the cached value for the board, or None on a miss."""
+        key, flipped = self.key_for(board)
+        value = self._lookup(key)
+        if value is None:
+            return None
+        return -value if flipped else value
+
+    def put(self, board: Board, value: float) -> None:
+        """Store the evaluation of the board."""
+        key, flipped = self.key_for(board)
+        self._store(key, -value if flipped else value)
+
+    def get_or_compute(self, board: Board, evaluate: Callable[[Board], float]) -> float:
+        """Return the cached value for the board, calling evaluate(board) on a miss."""
+        key, flipped = self.key_for(board)
+        value = self._lookup(key)
+        if value is None:
+            value = evaluate(board)
+            self._store(key, -value if flipped else value)
+            return value
+        return -value if flipped else value
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            bytes=len(self._entries) * ENTRY_BYTES,
+            max_bytes=self._max_bytes,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Internal
+    # ------------------------------------------------------------------ #
+    def _lookup(self, key: int) -> Optional[float]:
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _store(self, key: int, value: float) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, board: Board) -> bool:
+        return self.key_for(board)[0] in self._entries
+
+
+# one cache per worker process, shared by every search running in it
+_SHARED: Optional[EvalCache] = None
+DEFAULT_SHARED_BYTES = 16 << 20
+
+
+def configure_shared_cache(
+    max_bytes: int = DEFAULT_SHARED_BYTES, *, symmetric: bool = True
+) -> EvalCache:
+    """
+    Create the process-wide cache with the given settings and return it.
+    Calling it again with the same settings is a no-op; different settings raise
+    ValueError, since other searches may already hold the existing cache.
+    """
+    global _SHARED
+    if _SHARED is None:
+        _SHARED = EvalCache(max_bytes, symmetric=symmetric)
+    elif (_SHARED.max_bytes, _SHARED.symmetric) != (max_bytes, symmetric):
+        raise ValueError(
+            f"shared cache already configured with max_bytes={_SHARED.max_bytes}, "
+            f"symmetric={_SHARED.symmetric}"
+        )
+    return _SHARED
+
+
+def shared_cache() -> EvalCache:
+    """Return the process-wide cache, creating it with default settings if unconfigured."""
+    if _SHARED is None:
+        return configure_shared_cache()
+    return _SHARED
@@ -0,0 +1,254 @@
+"""Game state: whose turn it is, the board, and the (movement-only) turn rules."""
+
+from typing import ClassVar, FrozenSet, Optional, Sequence
+from warchest.core.action import Action, MoveAction, PassAction
+from warchest.core.board import AStartingLocations, BStartingLocations, Board, NeutralLocations
+from warchest.core.enums import ActionStatus, Control, LocationType, Player, TokenType
+from warchest.core.hex import Hex
+from warchest.core.tokens import Token
+
+# ----------------------------------------------------------------------
+# rules currently modelled
+# - players alternate; each turn a player moves one unit to an adjacent
+#   empty hex, or passes when no move is possible
+# - moving onto a control point takes control of it
+# - the first player to control CONTROL_TO_WIN points wins; the game is
+#   a draw after max_turns plies
+# -----------------------------------------------------------------------
+CONTROL_TO_WIN = 6
+DEFAULT_MAX_TURNS = 200
+
+OTHER_PLAYER = {Player.A: Player.B, Player.B: Player.A}
+PLAYER_CONTROL = {Player.A: Control.A, Player.B: Control.B}
+
+
+class GameState:
+    """Board plus turn bookkeeping; the object actions are validated against."""
+
+    __slots__ = ("board", "turn", "max_turns", "history", "_current", "_winner", "_points")
+
+    StartingLocations: ClassVar[dict[Player, FrozenSet[Hex]]] = {
+        Player.A: AStartingLocations,
+        Player.B: BStartingLocations,
+    }
+
+    def __init__(
+        self,
+        board: Optional[Board] = None,
+        *,
+        starting_player: Player = Player.A,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> None:
+        self.board: Board = board if board is not None else GameState.initial_board()
+        self.turn: int = 0  # plies played so far
+        self.max_turns: int = max_turns
+        self.history: list[Action] = []
+        self._current: Player = starting_player
+        self._winner: Optional[Player] = None
+        self._points: FrozenSet[Hex] = GameState.control_points(self.board)
+
+    # ------------------------------------------------------------------ #
+    # Setup
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def initial_board() -> Board:
+        """Return the default board: one unit on, and control of, each starting location."""
+        board = Board()
+        for player, starts in GameState.StartingLocations.items():
+            for hx in sorted(starts, key=lambda h: (h.q, h.r)):
+                if not board.in_bounds(hx):
+                    continue
+                token = Token.create(TokenType.BLANK, player)
+                # units on the board are moved like tokens in hand (see MoveAction.is_valid)
+                board.place(hx, Token(token.id, token.token_type, player, LocationType.HAND))
+                board.set_control(hx, PLAYER_CONTROL[player])
+        return board
+
+    @staticmethod
+    def control_points(board: Board) -> FrozenSet[Hex]:
+        """Return the control points that lie on the board's layout."""
+        points = NeutralLocations | AStartingLocations | BStartingLocations
+        return frozenset(hx for hx in points if board.in_bounds(hx))
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+    def get_current_player(self) -> Player:
+        """Return the player to move."""
+        return self._current
+
+    def winner(self) -> Optional[Player]:
+        """Return the winner, or None if the game is undecided or drawn."""
+        return self._winner
+
+    def is_over(self) -> bool:
+        """Return True once a player has won or the turn limit is reached."""
+        return self._winner is not None or self.turn >= self.max_turns
+
+    def is_control_point(self, hx: Hex) -> bool:
+        """Return True if hx is a control point."""
+        return hx in self._points
+
+    def controlled_by(self, player: Player) -> int:
+        """Return the number of control points held by player."""
+        ctrl = PLAYER_CONTROL[player]
+        return sum(1 for hx in self._points if self.board.control_of(hx) is ctrl)
+
+    def legal_actions(self) -> list[Action]:
+        """
+        Return the actions available to the player to move.
+        Moves are ordered by the board's dense hex index, then by Hex direction order.
+        """
+        player = self._current
+        board = self.board
+        idx = board.index
+        actions: list[Action] = []
+        for i, hx in enumerate(idx.hexes):
+            token = board.get_token_at(hx)
+            if token is None or token.owner != player:
+                continue
+            for j in idx.neighbours[i]:
+                move = MoveAction(player, token, hx, idx.hexes[j])
+                if move.is_valid(self):
+                    actions.append(move)
+        if not actions:
+            actions.append(PassAction(player))
+        return actions
+
+    # ------------------------------------------------------------------ #
+    # Mutation
+    # ------------------------------------------------------------------ #
+    def apply(self, action: Action) -> None:
+        """Validate and apply an action, then hand the turn to the other player."""
+        if self.is_over():
+            raise ValueError("game is over")
+        if not action.is_valid(self):
+            raise ValueError(f"invalid action: {action!r}")
+        action.apply(self)
+        if isinstance(action, MoveAction) and action.to_hex in self._points:
+            self.board.set_control(action.to_hex, PLAYER_CONTROL[action.player])
+            if self.controlled_by(action.player) >= CONTROL_TO_WIN:
+                self._winner = action.player
+        self.history.append(action)
+        self.turn += 1
+        self._current = OTHER_PLAYER[self._current]
+
+    def copy(self) -> "GameState":
+        """Return an independent copy of the state (history is copied shallowly)."""
+        new = GameState.__new__(GameState)
+        new.board = self.board.copy()
+        new.turn = self.turn
+        new.max_turns = self.max_turns
+        new.history = self.history.copy()
+        new._current = self._current
+        new._winner = self._winner
+        new._points = self._points
+        return new
+
+    def __repr__(self) -> str:
+        return f"GameState(turn={self.turn}, to_move={self._current.name}, winner={self._winner})"
+
+
+# --------------------------------------------------------------------------- #
+# batched validation / application
+# --------------------------------------------------------------------------- #
+
+
+def apply_batch(
+    game_state: GameState, actions: Sequence[Action], *, transactional: bool = False
+) -> list[ActionStatus]:
+    """
+    Validate and apply a sequence of actions in one pass; return one status per action.
+
+    Checks are the same as Action.is_valid followed by GameState.apply, in the same
+    order, but the board, the player to move and the control points are looked up
+    once per batch. Rejected actions are skipped and the batch carries on.
+
+    With transactional=True the batch is all-or-nothing: the board is snapshotted
+    once up front and, on the first failure, restored in place (the same Board
+    object), together with the turn, player to move, winner and history. The
+    statuses are then ROLLED_BACK, the failing code, and SKIPPED for the rest.
+    If an action's own is_valid/apply raises, a transactional batch is rolled back
+    the same way before the exception propagates.
+    """
+    board = game_state.board
+    points = game_state._points
+    player = game_state._current
+    turn = game_state.turn
+    max_turns = game_state.max_turns
+    winner = game_state._winner
+    history = game_state.history
+    start = (player, turn, winner, len(history))
+
+    snapshot = board.copy() if transactional else None
+    statuses: list[ActionStatus] = []
+
+    def rollback() -> None:
+        game_state.board = board  # in case a fallback action rebound it
+        board.restore(snapshot)
+        game_state._current, game_state.turn, game_state._winner = start[:3]
+        del history[start[3] :]
+
+    try:
+        for action in actions:
+            if winner is not None or turn >= max_turns:
+                status = ActionStatus.GAME_OVER
+            elif action.player != player:
+                status = ActionStatus.WRONG_PLAYER
+            elif type(action) is MoveAction:  # subclasses may override is_valid/apply
+                src, dst = action.from_hex, action.to_hex
+                token = board.get_token_at(src) if board.in_bounds(src) else None
+                if token is None or token != action.resource:
+                    status = ActionStatus.TOKEN_MISMATCH
+                elif token.location != LocationType.HAND or token.owner != player:
+                    status = ActionStatus.NOT_MOVABLE
+                elif src.distance(dst) != 1:
+                    status = ActionStatus.BAD_DISTANCE
+                elif not board.in_bounds(dst):
+                    status = ActionStatus.OFF_BOARD
+                elif board.get_token_at(dst) is not None:
+                    status = ActionStatus.DESTINATION_OCCUPIED
+                else:
+                    status = ActionStatus.OK
+                    board.move_token(src, dst)
+                    if dst in points:
+                        board.set_control(dst, PLAYER_CONTROL[player])
+                        if game_state.controlled_by(player) >= CONTROL_TO_WIN:
+                            winner = player
+            elif type(action) is PassAction:
+                status = ActionStatus.OK
+            else:
+                # any other action type: defer to its own validation and apply
+                game_state._current, game_state.turn, game_state._winner = player, turn, winner
+                if action.is_valid(game_state):
+                    status = ActionStatus.OK
+                    action.apply(game_state)
+                    if isinstance(action, MoveAction) and action.to_hex in points:
+                        # same capture rule as GameState.apply
+                        game_state.board.set_control(action.to_hex, PLAYER_CONTROL[player])
+                        if game_state.controlled_by(player) >= CONTROL_TO_WIN:
+                            winner = player
+                else:
+                    status = ActionStatus.INVALID
+
+            if status is ActionStatus.OK:
+                history.append(action)
+                turn += 1
+                player = OTHER_PLAYER[player]
+            elif snapshot is not None:
+                rollback()
+                statuses = [ActionStatus.ROLLED_BACK] * len(statuses)
+                statuses.append(status)
+                statuses.extend([ActionStatus.SKIPPED] * (len(actions) - len(statuses)))
+                return statuses
+            statuses.append(status)
+    except BaseException:
+        # an action's own is_valid/apply raised: undo the batch, or keep what was applied
+        if snapshot is not None:
+            rollback()
+        else:
+            game_state._current, game_state.turn, game_state._winner = player, turn, winner
+        raise
+
+    game_state._current, game_state.turn, game_state._winner = player, turn, winner
+    return statuses
@@ -0,0 +1,219 @@
+"""
+Fast random playouts on a flat integer encoding of a GameState.
+
+The kernel follows exactly the rules of GameState.apply and the move order of
+GameState.legal_actions, and draws from the RNG the same way RandomAgent /
+GreedyAgent do, so for the same seed a playout ends in the same position as
+play_game(agent, agent) with one shared agent. It allocates nothing per move:
+all state lives in a reusable PlayoutBuffer.
+"""
+
+import random
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+from warchest.core.board import layout_index
+from warchest.core.enums import Control, LocationType, Player
+from warchest.core.game_state import CONTROL_TO_WIN, GameState
+
+# occupancy codes; players share their codes with control and winner values
+EMPTY = 0
+A = 1
+B = 2
+BLOCKED = 3  # occupied by a token that cannot be moved
+
+_PLAYER_CODE = {Player.A: A, Player.B: B}
+_CODE_PLAYER = {A: Player.A, B: Player.B}
+_CONTROL_CODE = {Control.NEUTRAL: EMPTY, Control.A: A, Control.B: B}
+_CODE_CONTROL = {EMPTY: Control.NEUTRAL, A: Control.A, B: Control.B}
+
+
+class Policy(IntEnum):
+    """Move selection rules available to the kernel."""
+
+    RANDOM = 0  # same draws as RandomAgent
+    GREEDY = 1  # same draws as GreedyAgent
+
+
+# --------------------------------------------------------------------------- #
+# flat state
+# --------------------------------------------------------------------------- #
+
+
+@dataclass(slots=True)
+class FlatState:
+    """
+    A GameState as dense arrays indexed by layout_index(board.layout).
+
+    occ holds the owner code of the top token (BLOCKED if it cannot move), tid the
+    top token id (-1 if empty), ctrl the control code and point a 0/1 control-point
+    flag. nbr lists up to six neighbour indices per hex, padded with -1.
+    """
+
+    occ: bytearray
+    tid: array
+    ctrl: bytearray
+    point: bytearray
+    nbr: array
+    to_move: int
+    turn: int
+    max_turns: int
+    winner: int
+
+    @classmethod
+    def from_game(cls, gs: GameState) -> "FlatState":
+        """Encode a GameState."""
+        board = gs.board
+        idx = layout_index(board.layout)
+        n = len(idx.hexes)
+        occ = bytearray(n)
+        tid = array("i", [-1]) * n
+        ctrl = bytearray(n)
+        point = bytearray(n)
+        nbr = array("i", [-1]) * (6 * n)
+        for i, hx in enumerate(idx.hexes):
+            for k, j in enumerate(idx.neighbours[i]):
+                nbr[6 * i + k] = j
+            point[i] = gs.is_control_point(hx)
+            ctrl[i] = _CONTROL_CODE[board.control_of(hx)]
+            token = board.get_token_at(hx)
+            if token is not None:
+                tid[i] = token.id
+                movable = token.location is LocationType.HAND
+                occ[i] = _PLAYER_CODE[token.owner] if movable else BLOCKED
+        winner = gs.winner()
+        return cls(
+            occ=occ,
+            tid=tid,
+            ctrl=ctrl,
+            point=point,
+            nbr=nbr,
+            to_move=_PLAYER_CODE[gs.get_current_player()],
+            turn=gs.turn,
+            max_turns=gs.max_turns,
+            winner=EMPTY if winner is None else _PLAYER_CODE[winner],
+        )
+
+
+class PlayoutBuffer:
+    """Scratch space for playouts from positions on one layout; reuse it across calls."""
+
+    __slots__ = ("occ", "tid", "ctrl", "move_from", "move_to", "captures", "turn")
+
+    def __init__(self, n_hexes: int) -> None:
+        self.occ = bytearray(n_hexes)
+        self.tid = array("i", [-1]) * n_hexes
+        self.ctrl = bytearray(n_hexes)
+        self.move_from = array("H", [0]) * (6 * n_hexes)
+        self.move_to = array("H", [0]) * (6 * n_hexes)
+        self.captures = array("H", [0]) * (6 * n_hexes)  # positions into move_from/move_to
+        self.turn = 0  # ply count when the last playout ended
+
+    @classmethod
+    def for_state(cls, state: FlatState) -> "PlayoutBuffer":
+        """Return a buffer sized for the state's layout."""
+        return cls(len(state.occ))
+
+    def control(self, i: int) -> Control:
+        """Return the control of hex i after the last playout."""
+        return _CODE_CONTROL[self.ctrl[i]]
+
+
+# --------------------------------------------------------------------------- #
+# kernel
+# --------------------------------------------------------------------------- #
+
+
+def playout(
+    state: FlatState,
+    rng: random.Random,
+    buf: PlayoutBuffer,
+    policy: Policy = Policy.RANDOM,
+) -> int:
+    """
+    Play the state out to the end with `policy` for both sides.
+    Returns the winner's code (A or B) or EMPTY for a draw; `state` is not modified,
+    the final position is left in `buf`, which must be sized for the state's layout.
+    """
+    if len(buf.occ) != len(state.occ):
+        raise ValueError(
+            f"buffer is sized for {len(buf.occ)} hexes but the state has {len(state.occ)}; "
+            "use PlayoutBuffer.for_state"
+        )
+    occ, tid, ctrl = buf.occ, buf.tid, buf.ctrl
+    occ[:] = state.occ
+    tid[:] = state.tid
+    ctrl[:] = state.ctrl
+    move_from, move_to, captures = buf.move_from, buf.move_to, buf.captures
+    point, nbr = state.point, state.nbr
+    randrange = rng.randrange
+    greedy = policy is Policy.GREEDY
+
+    held = [0, 0, 0]
+    for code in (A, B):
+        held[code] = sum(1 for i, c in enumerate(ctrl) if c == code and point[i])
+
+    side = state.to_move
+    turn = state.turn
+    max_turns = state.max_turns
+    winner = state.winner
+
+    while winner == EMPTY and turn < max_turns:
+        # generate moves in GameState.legal_actions order
+        m = 0
+        c = 0
+        i = occ.find(side)
+        while i >= 0:
+            base = 6 * i
+            for k in range(base, base + 6):
+                j = nbr[k]
+                if j < 0:
+                    break
+                if occ[j] == EMPTY:
+                    move_from[m] = i
+                    move_to[m] = j
+                    if greedy and point[j] and ctrl[j] != side:
+                        captures[c] = m
+                        c += 1
+                    m += 1
+            i = occ.find(side, i + 1)
+
+        if m == 0:
+            randrange(1)  # the agents still draw to pick the lone pass
+        else:
+            if c:
+                pick = captures[randrange(c)]
+            else:
+                pick = randrange(m)
+            i = move_from[pick]
+            j = move_to[pick]
+            occ[j] = occ[i]
+            occ[i] = EMPTY
+            tid[j] = tid[i]
+            tid[i] = -1
+            if point[j]:
+                owner = ctrl[j]
+                if owner != side:
+                    held[owner] -= 1  # held[EMPTY] is a dummy slot
+                    held[side] += 1
+                    ctrl[j] = side
+                if held[side] >= CONTROL_TO_WIN:
+                    winner = side
+
+        turn += 1
+        side = 3 - side
+
+    buf.turn = turn
+    return winner
+
+
+def playout_game(
+    gs: GameState,
+    seed: Optional[int] = None,
+    policy: Policy = Policy.RANDOM,
+) -> Optional[Player]:
+    """Convenience wrapper: encode gs, play it out once and return the winner."""
+    state = FlatState.from_game(gs)
+    code = playout(state, random.Random(seed), PlayoutBuffer.for_state(state), policy)
+    return _CODE_PLAYER.get(code)
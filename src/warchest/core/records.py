@@ -0,0 +1,122 @@
+"""Game records: the move list of a finished game, stored one JSON object per line."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+from warchest.core.action import Action, MoveAction, PassAction
+from warchest.core.enums import Player
+from warchest.core.game_state import DEFAULT_MAX_TURNS, OTHER_PLAYER, GameState
+from warchest.core.hex import Hex
+
+# a move is ((from_q, from_r), (to_q, to_r)), or None for a pass
+Move = Optional[tuple[tuple[int, int], tuple[int, int]]]
+
+
+@dataclass(slots=True)
+class GameRecord:
+    """A game from the default initial position, as a list of moves."""
+
+    starting_player: Player = Player.A
+    moves: list[Move] = field(default_factory=list)
+    winner: Optional[Player] = None
+    max_turns: int = DEFAULT_MAX_TURNS
+
+    @classmethod
+    def from_game(cls, gs: GameState, starting_player: Player) -> "GameRecord":
+        """Record the history of a game that started from GameState.initial_board()."""
+        moves: list[Move] = []
+        for action in gs.history:
+            if isinstance(action, MoveAction):
+                src, dst = action.from_hex, action.to_hex
+                moves.append(((src.q, src.r), (dst.q, dst.r)))
+            else:
+                moves.append(None)
+        return cls(starting_player, moves, gs.winner(), gs.max_turns)
+
+    def new_game(self) -> GameState:
+        """Return the initial state this record starts from."""
+        return GameState(starting_player=self.starting_player, max_turns=self.max_turns)
+
+    def action_at(self, gs: GameState, ply: int) -> Action:
+        """Build the Action for move number ply in state gs (the state before that move)."""
+        move = self.moves[ply]
+        player = gs.get_current_player()
+        if move is None:
+            return PassAction(player)
+        src, dst = Hex(*move[0]), Hex(*move[1])
+        token = gs.board.get_token_at(src)
+        return MoveAction(player, token, src, dst)
+
+    def actions(self, gs: GameState) -> list[Action]:
+        """
+        Build the whole action list up front, without validating or applying anything;
+        gs must be the state the record starts from (see new_game).
+        Tokens are followed from hex to hex so each MoveAction names the token that
+        should be at its from-hex when it is played.
+        """
+        tops = {hx: cell.top() for hx, cell in gs.board}
+        player = gs.get_current_player()
+        out: list[Action] = []
+        for move in self.moves:
+            if move is None:
+                out.append(PassAction(player))
+            else:
+                src, dst = Hex(*move[0]), Hex(*move[1])
+                token = tops.pop(src, None)
+                tops[dst] = token
+                out.append(MoveAction(player, token, src, dst))
+            player = OTHER_PLAYER[player]
+        return out
+
+    def replay(self) -> Iterator[tuple[GameState, Action]]:
+        """Yield (state before the move, move) for every ply; the state is reused."""
+        gs = self.new_game()
+        for ply in range(len(self.moves)):
+            action = self.action_at(gs, ply)
+            yield gs, action
+            gs.apply(action)
+
+    # ------------------------------------------------------------------ #
+    # (de)serialisation
+    # ------------------------------------------------------------------ #
+    def to_json(self) -> str:
+        """Serialise to one line of JSON."""
+        return json.dumps(
+            {
+                "start": self.starting_player.name,
+                "moves": [None if m is None else [*m[0], *m[1]] for m in self.moves],
+                "winner": None if self.winner is None else self.winner.name,
+                "max_turns": self.max_turns,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "GameRecord":
+        """Parse one line written by to_json."""
+        data = json.loads(line)
+        moves: list[Move] = [
+            None if m is None else ((m[0], m[1]), (m[2], m[3])) for m in data["moves"]
+        ]
+        winner = data.get("winner")
+        return cls(
+            Player[data["start"]],
+            moves,
+            None if winner is None else Player[winner],
+            data.get("max_turns", DEFAULT_MAX_TURNS),
+        )
+
+
+def write_records(path: str, records: Iterable[GameRecord]) -> None:
+    """Append records to a JSON-lines file."""
+    with open(path, "a", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(record.to_json())
+            fh.write("\n")
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    """Stream records from a JSON-lines file, skipping blank lines."""
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield GameRecord.from_json(line)
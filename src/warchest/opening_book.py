@@ -0,0 +1,181 @@
+"""
+Opening book: per-position move statistics from self-play, in a memory-mapped file.
+
+File layout (little endian)::
+
+    header   magic "WCBK" | version u16 | max_ply u16 | count u64 | reserved u64
+    records  key u64 | from u16 | to u16 | games u32 | wins u32 | draws u32
+
+Records are sorted by (key, from, to). Wins and draws are counted for the player
+who made the move. A pass is stored as from = to = PASS. Lookups binary-search
+the mapped file directly, so nothing is parsed at load time and every process
+opening the same book shares its pages through the OS page cache.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from warchest.core.action import Action, MoveAction
+from warchest.core.eval_cache import position_key
+from warchest.core.game_state import GameState
+from warchest.core.hex import Hex
+from warchest.core.records import GameRecord
+
+MAGIC = b"WCBK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQ")
+RECORD = struct.Struct("<QHHIII")
+_KEY = struct.Struct("<Q")
+PASS = 0xFFFF
+
+
+def position_hash(gs: GameState) -> int:
+    """Stable 64-bit hash of the board contents and the player to move."""
+    data = repr((position_key(gs.board), gs.get_current_player().name)).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _encode_move(gs: GameState, action: Action) -> tuple[int, int]:
+    if isinstance(action, MoveAction):
+        index = gs.board.index.index
+        return index[action.from_hex], index[action.to_hex]
+    return PASS, PASS
+
+
+@dataclass(frozen=True, slots=True)
+class BookMove:
+    """One book entry for a position."""
+
+    from_hex: Optional[Hex]  # None for a pass
+    to_hex: Optional[Hex]
+    games: int
+    wins: int
+    draws: int
+
+    @property
+    def score(self) -> float:
+        """Average score for the player making the move."""
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.0
+
+
+# --------------------------------------------------------------------------- #
+# building
+# --------------------------------------------------------------------------- #
+
+
+def build_book(
+    records: Iterable[GameRecord], path: str, *, max_ply: int = 12, min_games: int = 1
+) -> int:
+    """
+    Aggregate the first max_ply moves of every record and write the book to path.
+    Moves seen in fewer than min_games games are dropped. Returns the record count.
+    """
+    if not 0 <= max_ply <= 0xFFFF:
+        raise ValueError("max_ply must fit in 16 bits")
+    stats: dict[tuple[int, int, int], list[int]] = defaultdict(lambda: [0, 0, 0])
+    for record in records:
+        for ply, (gs, action) in enumerate(record.replay()):
+            if ply >= max_ply:
+                break
+            entry = stats[(position_hash(gs), *_encode_move(gs, action))]
+            entry[0] += 1
+            if record.winner is None:
+                entry[2] += 1
+            elif record.winner is gs.get_current_player():
+                entry[1] += 1
+
+    rows = sorted((key, games) for key, games in stats.items() if games[0] >= min_games)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, max_ply, len(rows), 0))
+        for (key, src, dst), (games, wins, draws) in rows:
+            fh.write(RECORD.pack(key, src, dst, games, wins, draws))
+    os.replace(tmp, path)
+    return len(rows)
+
+
+# --------------------------------------------------------------------------- #
+# lookup
+# --------------------------------------------------------------------------- #
+
+
+class OpeningBook:
+    """Read-only, memory-mapped view of a book file."""
+
+    __slots__ = ("_file", "_mm", "max_ply", "count")
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is not an opening book")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_ply, self.count, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        if len(self._mm) != HEADER.size + self.count * RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def _key_at(self, i: int) -> int:
+        return _KEY.unpack_from(self._mm, HEADER.size + i * RECORD.size)[0]
+
+    def _lower_bound(self, key: int) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lookup(self, key: int) -> list[tuple[int, int, int, int, int]]:
+        """Return raw (from, to, games, wins, draws) rows stored for a position hash."""
+        rows = []
+        i = self._lower_bound(key)
+        while i < self.count:
+            k, src, dst, games, wins, draws = RECORD.unpack_from(
+                self._mm, HEADER.size + i * RECORD.size
+            )
+            if k != key:
+                break
+            rows.append((src, dst, games, wins, draws))
+            i += 1
+        return rows
+
+    def probe(self, gs: GameState) -> list[BookMove]:
+        """Return the book moves for a position, most played first."""
+        if gs.turn >= self.max_ply:
+            return []
+        hexes = gs.board.index.hexes
+        moves = [
+            BookMove(
+                None if src == PASS else hexes[src],
+                None if dst == PASS else hexes[dst],
+                games,
+                wins,
+                draws,
+            )
+            for src, dst, games, wins, draws in self.lookup(position_hash(gs))
+        ]
+        return sorted(moves, key=lambda m: (m.games, m.score), reverse=True)
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
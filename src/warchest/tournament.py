@@ -0,0 +1,460 @@
+"""Round-robin tournament runner with SPRT early stopping, checkpoints and Elo estimates."""
+
+import json
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from itertools import combinations
+from typing import Callable, Iterator, Optional, Sequence
+from warchest.agents import Agent
+from warchest.core.enums import Player
+from warchest.core.game_state import DEFAULT_MAX_TURNS, GameState
+from warchest.core.records import GameRecord
+
+# an agent factory builds a fresh agent from a seed; it must be picklable
+# (a module-level class or function) to be sent to worker processes
+AgentFactory = Callable[[int], Agent]
+
+CHECKPOINT_VERSION = 1
+
+
+# --------------------------------------------------------------------------- #
+# single games
+# --------------------------------------------------------------------------- #
+
+
+def play_game(
+    agent_a: Agent,
+    agent_b: Agent,
+    *,
+    starting_player: Player = Player.A,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> Optional[Player]:
+    """Play one game from the initial position; return the winner or None for a draw."""
+    gs = GameState(starting_player=starting_player, max_turns=max_turns)
+    _play_out(gs, agent_a, agent_b)
+    return gs.winner()
+
+
+def self_play(
+    factory_a: AgentFactory,
+    factory_b: AgentFactory,
+    games: int,
+    *,
+    seed: int = 0,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> Iterator[GameRecord]:
+    """Yield the records of `games` games, alternating the starting player."""
+    rng = random.Random(seed)
+    for game in range(games):
+        starting = Player.A if game % 2 == 0 else Player.B
+        gs = GameState(starting_player=starting, max_turns=max_turns)
+        _play_out(gs, factory_a(rng.getrandbits(32)), factory_b(rng.getrandbits(32)))
+        yield GameRecord.from_game(gs, starting)
+
+
+def _play_out(gs: GameState, agent_a: Agent, agent_b: Agent) -> None:
+    agents = {Player.A: agent_a, Player.B: agent_b}
+    while not gs.is_over():
+        gs.apply(agents[gs.get_current_player()].choose_action(gs))
+
+
+def _play_scheduled(
+    factory_a: AgentFactory, factory_b: AgentFactory, seed: str, game: int, max_turns: int
+) -> float:
+    """Worker entry point: play game number `game` of a pairing, return A's score."""
+    rng = random.Random(seed)
+    agent_a = factory_a(rng.getrandbits(32))
+    agent_b = factory_b(rng.getrandbits(32))
+    starting = Player.A if game % 2 == 0 else Player.B
+    winner = play_game(agent_a, agent_b, starting_player=starting, max_turns=max_turns)
+    if winner is None:
+        return 0.5
+    return 1.0 if winner is Player.A else 0.0
+
+
+# --------------------------------------------------------------------------- #
+# statistics
+# --------------------------------------------------------------------------- #
+
+
+def elo_to_score(elo: float) -> float:
+    """Expected score for an Elo advantage."""
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+def score_to_elo(score: float) -> float:
+    """Elo advantage for an expected score; clamped to avoid infinities."""
+    score = min(max(score, 1e-6), 1.0 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def _score_stats(wins: int, draws: int, losses: int) -> tuple[float, float, int]:
+    """
+    Return (mean score, per-game variance, games) for a W/D/L record.
+    The variance includes a pseudo-count of half a win and half a loss so that
+    sweeps and all-draw records do not have zero variance.
+    """
+    n = wins + draws + losses
+    if n == 0:
+        return 0.5, 0.0, 0
+    mean = (wins + 0.5 * draws) / n
+    pseudo_n = n + 1
+    pseudo_mean = (wins + 0.5 * draws + 0.5) / pseudo_n
+    second = (wins + 0.25 * draws + 0.5) / pseudo_n
+    return mean, second - pseudo_mean * pseudo_mean, n
+
+
+def sprt_llr(wins: int, draws: int, losses: int, elo0: float, elo1: float) -> float:
+    """Log-likelihood ratio of H1 (elo = elo1) vs H0 (elo = elo0), normal approximation."""
+    mean, var, n = _score_stats(wins, draws, losses)
+    if n == 0:
+        return 0.0
+    s0, s1 = elo_to_score(elo0), elo_to_score(elo1)
+    return 0.5 * n * (s1 - s0) * (2.0 * mean - s0 - s1) / var
+
+
+def elo_interval(wins: int, draws: int, losses: int, z: float = 1.96) -> tuple[float, float, float]:
+    """Return (elo, low, high) for a W/D/L record with a z-sigma confidence interval."""
+    mean, var, n = _score_stats(wins, draws, losses)
+    if n == 0:
+        return 0.0, -math.inf, math.inf
+    half = z * math.sqrt(var / n)
+    return score_to_elo(mean), score_to_elo(mean - half), score_to_elo(mean + half)
+
+
+@dataclass(frozen=True, slots=True)
+class SPRTConfig:
+    """Stopping rule for a pairing: test |elo| >= elo1 against elo = elo0."""
+
+    elo0: float = 0.0
+    elo1: float = 50.0
+    alpha: float = 0.05
+    beta: float = 0.05
+    max_games: int = 2000
+
+    @property
+    def lower(self) -> float:
+        """LLR below which H0 is accepted."""
+        return math.log(self.beta / (1.0 - self.alpha))
+
+    @property
+    def upper(self) -> float:
+        """LLR above which H1 is accepted."""
+        return math.log((1.0 - self.beta) / self.alpha)
+
+
+# --------------------------------------------------------------------------- #
+# bookkeeping
+# --------------------------------------------------------------------------- #
+
+
+@dataclass(slots=True)
+class PairRecord:
+    """Results of one pairing, from a's point of view."""
+
+    a: str
+    b: str
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    scheduled: int = 0  # next new game number to hand out
+    decision: Optional[str] = None  # winner's name, "equal" or "max_games"
+    in_flight: list[int] = field(default_factory=list)  # handed out, result not in yet
+
+    @property
+    def games(self) -> int:
+        """Number of finished games."""
+        return self.wins + self.draws + self.losses
+
+    def add(self, score: float) -> None:
+        """Record one game result (1, 0.5 or 0 for a)."""
+        if score == 1.0:
+            self.wins += 1
+        elif score == 0.0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def update_decision(self, sprt: SPRTConfig) -> None:
+        """Run the two one-sided SPRTs (a stronger / b stronger) and record a decision."""
+        if self.decision is not None:
+            return
+        a_better = sprt_llr(self.wins, self.draws, self.losses, sprt.elo0, sprt.elo1)
+        b_better = sprt_llr(self.losses, self.draws, self.wins, sprt.elo0, sprt.elo1)
+        if a_better >= sprt.upper:
+            self.decision = self.a
+        elif b_better >= sprt.upper:
+            self.decision = self.b
+        elif a_better <= sprt.lower and b_better <= sprt.lower:
+            self.decision = "equal"
+        elif self.games >= sprt.max_games:
+            self.decision = "max_games"
+
+    def elo(self, z: float = 1.96) -> tuple[float, float, float]:
+        """Elo of a relative to b with a confidence interval."""
+        return elo_interval(self.wins, self.draws, self.losses, z)
+
+
+@dataclass(frozen=True, slots=True)
+class Rating:
+    """Rating of one entrant from the joint fit over all pairings."""
+
+    name: str
+    elo: float
+    low: float
+    high: float
+    games: int
+
+
+_ELO_PER_LOGIT = 400.0 / math.log(10.0)
+
+
+def _solve(matrix: list[list[float]], rhs: list[float]) -> list[float]:
+    """Solve matrix @ x = rhs by Gaussian elimination with partial pivoting."""
+    k = len(rhs)
+    m = [row[:] + [b] for row, b in zip(matrix, rhs)]
+    for col in range(k):
+        pivot = max(range(col, k), key=lambda i: abs(m[i][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        for i in range(col + 1, k):
+            f = m[i][col] / m[col][col]
+            for j in range(col, k + 1):
+                m[i][j] -= f * m[col][j]
+    x = [0.0] * k
+    for i in reversed(range(k)):
+        x[i] = (m[i][k] - sum(m[i][j] * x[j] for j in range(i + 1, k))) / m[i][i]
+    return x
+
+
+def bradley_terry(
+    names: Sequence[str], pairs: Sequence[PairRecord], z: float = 1.96
+) -> list[Rating]:
+    """
+    Fit Elo ratings to all pairings jointly by maximum likelihood, strongest first.
+
+    Each pairing contributes its own score (a draw counts half) under the Elo
+    expected-score curve, so a long pairing does not swamp the others the way pooled
+    W/D/L records do. Every pairing gets a prior of half a win and half a loss (as in
+    the SPRT variance) which keeps sweeps finite. Ratings are anchored to a mean of
+    zero; the intervals are z standard errors from the Fisher information.
+    """
+    k = len(names)
+    pos = {name: i for i, name in enumerate(names)}
+    # (i, j, score of i, games) with the prior folded in
+    data = [
+        (pos[p.a], pos[p.b], p.wins + 0.5 * p.draws + 0.5, p.games + 1.0) for p in pairs
+    ]
+    games = [0] * k
+    for p in pairs:
+        games[pos[p.a]] += p.games
+        games[pos[p.b]] += p.games
+
+    beta = [0.0] * k  # natural-log scale
+    for _ in range(100):
+        grad = [0.0] * k
+        # Fisher information plus the all-ones matrix, which pins the mean at zero
+        info = [[1.0] * k for _ in range(k)]
+        for i, j, score, n in data:
+            p = 1.0 / (1.0 + math.exp(beta[j] - beta[i]))
+            g, w = score - n * p, n * p * (1.0 - p)
+            grad[i] += g
+            grad[j] -= g
+            info[i][i] += w
+            info[j][j] += w
+            info[i][j] -= w
+            info[j][i] -= w
+        step = _solve(info, grad)
+        beta = [b + min(max(d, -1.0), 1.0) for b, d in zip(beta, step)]
+        if max(abs(d) for d in step) < 1e-9:
+            break
+
+    # covariance of mean-anchored ratings: pseudo-inverse of the Fisher information
+    out = []
+    for i, name in enumerate(names):
+        unit = [1.0 if j == i else 0.0 for j in range(k)]
+        var = max(_solve(info, unit)[i] - 1.0 / (k * k), 0.0)
+        elo = beta[i] * _ELO_PER_LOGIT
+        if games[i] == 0:
+            low, high = -math.inf, math.inf
+        else:
+            half = z * math.sqrt(var) * _ELO_PER_LOGIT
+            low, high = elo - half, elo + half
+        out.append(Rating(name, elo, low, high, games[i]))
+    return sorted(out, key=lambda r: r.elo, reverse=True)
+
+
+# --------------------------------------------------------------------------- #
+# runner
+# --------------------------------------------------------------------------- #
+
+
+class Tournament:
+    """
+    Round-robin between named agent factories.
+
+    Games of a pairing alternate the starting player (Player.A on even game
+    numbers, Player.B on odd ones); the first-named entrant always sits as Player.A.
+    Each pairing stops as soon as its SPRT reaches a decision. Progress is written
+    to `checkpoint` (JSON) after every batch of results and picked up again by a
+    later run with the same entrants.
+    """
+
+    def __init__(
+        self,
+        entrants: Sequence[tuple[str, AgentFactory]],
+        *,
+        sprt: SPRTConfig = SPRTConfig(),
+        workers: int = 1,
+        checkpoint: Optional[str] = None,
+        seed: int = 0,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> None:
+        names = [name for name, _ in entrants]
+        if len(set(names)) != len(names):
+            raise ValueError(f"duplicate entrant names: {names}")
+        if len(entrants) < 2:
+            raise ValueError("a tournament needs at least two entrants")
+        self.factories: dict[str, AgentFactory] = dict(entrants)
+        self.sprt = sprt
+        self.workers = max(1, workers)
+        self.checkpoint = checkpoint
+        self.seed = seed
+        self.max_turns = max_turns
+        self.pairs: list[PairRecord] = [PairRecord(a, b) for a, b in combinations(names, 2)]
+        # game numbers lost in flight by an interrupted run, replayed first
+        self._retry: dict[tuple[str, str], list[int]] = {}
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._load(checkpoint)
+
+    # ------------------------------------------------------------------ #
+    # Public helpers
+    # ------------------------------------------------------------------ #
+    def run(self) -> list[PairRecord]:
+        """Play until every pairing has a decision; return the pair records."""
+        if self.workers == 1:
+            self._run_inline()
+        else:
+            self._run_pool()
+        return self.pairs
+
+    def ratings(self, z: float = 1.96) -> list[Rating]:
+        """Per-entrant Elo from a joint fit over all pairings, strongest first."""
+        return bradley_terry(list(self.factories), self.pairs, z)
+
+    def report(self, z: float = 1.96) -> str:
+        """Return a plain-text summary of pairings and ratings."""
+        lines = ["pairing                      W     D     L   elo (CI)          decision"]
+        for p in self.pairs:
+            elo, low, high = p.elo(z)
+            lines.append(
+                f"{p.a + ' vs ' + p.b:<24} {p.wins:>5} {p.draws:>5} {p.losses:>5}"
+                f"   {elo:+6.1f} [{low:+.0f}, {high:+.0f}]   {p.decision or '-'}"
+            )
+        lines.append("")
+        lines.append("entrant                  games   elo (CI)")
+        for r in self.ratings(z):
+            lines.append(f"{r.name:<24} {r.games:>5}   {r.elo:+6.1f} [{r.low:+.0f}, {r.high:+.0f}]")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------ #
+    # Scheduling
+    # ------------------------------------------------------------------ #
+    def _next_jobs(self) -> Iterator[tuple[PairRecord, int]]:
+        """
+        Round-robin over undecided pairings, handing out one game number at a time.
+        Games lost by an interrupted run are replayed (same number, same seed) first.
+        """
+        while True:
+            open_pairs = [
+                p
+                for p in self.pairs
+                if p.decision is None
+                and (self._retry.get((p.a, p.b)) or p.scheduled < self.sprt.max_games)
+            ]
+            if not open_pairs:
+                return
+            for pair in open_pairs:
+                if pair.decision is not None:
+                    continue
+                retry = self._retry.get((pair.a, pair.b))
+                if retry:
+                    game = retry.pop(0)
+                elif pair.scheduled < self.sprt.max_games:
+                    game = pair.scheduled
+                    pair.scheduled += 1
+                else:
+                    continue
+                pair.in_flight.append(game)
+                yield pair, game
+
+    def _job_args(self, pair: PairRecord, game: int) -> tuple:
+        seed = f"{self.seed}:{pair.a}:{pair.b}:{game}"
+        return self.factories[pair.a], self.factories[pair.b], seed, game, self.max_turns
+
+    def _record(self, pair: PairRecord, game: int, score: float) -> None:
+        pair.in_flight.remove(game)
+        pair.add(score)
+        pair.update_decision(self.sprt)
+
+    def _run_inline(self) -> None:
+        for pair, game in self._next_jobs():
+            self._record(pair, game, _play_scheduled(*self._job_args(pair, game)))
+            self._save()
+        self._save()
+
+    def _run_pool(self) -> None:
+        jobs = self._next_jobs()
+        pending: dict[Future, tuple[PairRecord, int]] = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+
+            def fill() -> None:
+                while len(pending) < 2 * self.workers:
+                    job = next(jobs, None)
+                    if job is None:
+                        return
+                    pair, game = job
+                    future = pool.submit(_play_scheduled, *self._job_args(pair, game))
+                    pending[future] = (pair, game)
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    self._record(*pending.pop(fut), fut.result())
+                self._save()
+                fill()
+        self._save()
+
+    # ------------------------------------------------------------------ #
+    # Checkpoints
+    # ------------------------------------------------------------------ #
+    def _save(self) -> None:
+        if self.checkpoint is None:
+            return
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "seed": self.seed,
+            "pairs": [asdict(p) for p in self.pairs],
+        }
+        tmp = f"{self.checkpoint}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, self.checkpoint)  # atomic: an interrupted write keeps the old file
+
+    def _load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version in {path}")
+        saved = {(p["a"], p["b"]): PairRecord(**p) for p in data["pairs"]}
+        if set(saved) != {(p.a, p.b) for p in self.pairs}:
+            raise ValueError(f"checkpoint {path} was written for different entrants")
+        self.seed = data["seed"]
+        self.pairs = [saved[(p.a, p.b)] for p in self.pairs]
+        for pair in self.pairs:
+            if pair.in_flight and pair.decision is None:
+                self._retry[(pair.a, pair.b)] = sorted(pair.in_flight)
+            pair.in_flight = []
@@ -126,3 +126,16 @@ def test_moveaction_invalid_distance():
 
     move = MoveAction(player, token, from_hex, to_hex)
     assert not move.is_valid(gs)
+
+
+def test_moveaction_invalid_empty_or_offboard_source():
+    """Test that move validation fails when the source is empty or off the board."""
+    player = Player.A
+    board = Board()
+    gs = DummyGameState(player, board)
+
+    assert not MoveAction(player, None, Hex(0, 0), Hex(0, 1)).is_valid(gs)
+
+    token = Token.create(TokenType.BLANK, player)
+    token = Token(token.id, token.token_type, player, LocationType.HAND)
+    assert not MoveAction(player, token, Hex(5, 5), Hex(5, 4)).is_valid(gs)
@@ -1,7 +1,8 @@
 """Tests for the Board class and related functionality."""
 
+import random
 import pytest
-from warchest.core.board import BoardHexes, Board, Cell, Control
+from warchest.core.board import BoardHexes, Board, Cell, Control, UNREACHABLE, layout_index
 from warchest.core.hex import Hex
 from warchest.core.tokens import Token
 from warchest.core.enums import TokenType, Player
@@ -11,6 +12,7 @@ CENTER_HEX = Hex(0, 0)
 ADJACENT_HEX = Hex(0, 1)
 OUT_OF_BOUNDS_HEX = Hex(5, 5)
 CUSTOM_LAYOUT = frozenset({CENTER_HEX, Hex(1, 1)})
+LINE_LAYOUT = frozenset(Hex(q, 0) for q in range(5))
 
 
 def test_board_hexes_initialization():
@@ -208,3 +210,121 @@ def test_bound_control():
 
     with pytest.raises(ValueError):
         board.set_control(OUT_OF_BOUNDS_HEX, Control.A)
+
+
+def test_layout_index_dense_and_symmetric_adjacency():
+    """Verify the dense index covers the layout and adjacency is symmetric."""
+    idx = layout_index(BoardHexes)
+    assert set(idx.hexes) == set(BoardHexes)
+    assert [idx.index[hx] for hx in idx.hexes] == list(range(len(BoardHexes)))
+    for i, nbs in enumerate(idx.neighbours):
+        assert all(i in idx.neighbours[j] for j in nbs)
+    assert len(idx.neighbours[idx.index[CENTER_HEX]]) == 6
+
+
+def test_distance_field_blockers():
+    """Verify occupied hexes get a distance but are not passed through."""
+    board = Board(layout=LINE_LAYOUT)
+    board.place(Hex(2, 0), Token.create(TokenType.BLANK, Player.B))
+
+    assert board.distance([CENTER_HEX], Hex(1, 0)) == 1
+    assert board.distance([CENTER_HEX], Hex(2, 0)) == 2  # blocker is reachable
+    assert board.distance([CENTER_HEX], Hex(3, 0)) is None  # but not passable
+    assert board.within([CENTER_HEX], 1) == {CENTER_HEX, Hex(1, 0)}
+
+    # an occupied source still expands
+    board.place(CENTER_HEX, Token.create(TokenType.BLANK, Player.A))
+    assert board.distance([CENTER_HEX], Hex(1, 0)) == 1
+
+
+def test_distance_field_max_distance():
+    """Verify max_distance truncates the search."""
+    board = Board()
+    field_ = board.distance_field([CENTER_HEX], max_distance=1)
+    reached = {board.index.hexes[i] for i, d in enumerate(field_) if d != UNREACHABLE}
+    assert reached == {CENTER_HEX, *CENTER_HEX.ring(1)}
+
+    with pytest.raises(ValueError):
+        board.distance_field([CENTER_HEX], max_distance=-1)
+    with pytest.raises(ValueError):
+        board.distance_field([OUT_OF_BOUNDS_HEX])
+
+
+def test_distance_field_cache_invalidation():
+    """Verify cached fields are reused and invalidated by occupancy changes."""
+    board = Board(layout=LINE_LAYOUT)
+    first = board.distance_field([CENTER_HEX])
+    assert board.distance_field([CENTER_HEX]) is first
+
+    token = Token.create(TokenType.BLANK, Player.A)
+    board.place(Hex(2, 0), token)
+    blocked = board.distance_field([CENTER_HEX])
+    assert blocked is not first
+    # placing on top of an existing stack does not change occupancy
+    board.place(Hex(2, 0), Token.create(TokenType.BLANK, Player.A))
+    assert board.distance_field([CENTER_HEX]) is blocked
+
+    board.move_token(Hex(2, 0), Hex(3, 0))
+    assert board.distance([CENTER_HEX], Hex(3, 0)) == 3
+
+    board.remove_top(Hex(3, 0))
+    board.remove_top(Hex(3, 0))
+    assert board.distance_field([CENTER_HEX]) == first
+
+
+def test_distance_field_matches_fresh_board():
+    """Verify incrementally maintained fields equal freshly computed ones."""
+    rng = random.Random(7)
+    hexes = sorted(BoardHexes, key=lambda hx: (hx.q, hx.r))
+    board = Board()
+    queries = [[CENTER_HEX], [Hex(3, 1)], [Hex(-3, -1), Hex(0, 2)]]
+    for _ in range(200):
+        for sources in queries:
+            board.distance_field(sources, max_distance=rng.choice([None, 2]))
+        occupied = [hx for hx, cell in board if cell.stack]
+        op = rng.random()
+        if occupied and op < 0.3:
+            board.remove_top(rng.choice(occupied))
+        elif occupied and op < 0.6:
+            empty = [hx for hx in hexes if board.get_token_at(hx) is None]
+            board.move_token(rng.choice(occupied), rng.choice(empty))
+        else:
+            board.place(rng.choice(hexes), Token.create(TokenType.BLANK, Player.A))
+
+        fresh = Board(pairs=[(hx, tk) for hx, cell in board for tk in cell.stack])
+        for sources in queries:
+            for limit in (None, 2):
+                assert board.distance_field(sources, limit) == fresh.distance_field(sources, limit)
+
+
+def test_distance_field_cache_is_bounded(monkeypatch):
+    """Verify the field cache keeps at most MaxCachedFields, evicting the least recent."""
+    monkeypatch.setattr(Board, "MaxCachedFields", 3)
+    board = Board()
+    sources = [[hx] for hx in sorted(BoardHexes, key=lambda hx: (hx.q, hx.r))[:4]]
+    fields = [board.distance_field(src) for src in sources[:3]]
+    assert board.distance_field(sources[0]) is fields[0]  # refresh the oldest
+
+    board.distance_field(sources[3])
+    assert len(board._fields) == 3
+    assert board.distance_field(sources[0]) is fields[0]
+    assert board.distance_field(sources[1]) is not fields[1]  # evicted, recomputed
+    assert len(board._fields) == 3
+    assert len(board.copy()._fields) == 3
+
+
+def test_board_restore_in_place():
+    """Verify restore resets contents without replacing the board object."""
+    board = Board()
+    board.place(CENTER_HEX, Token.create(TokenType.BLANK, Player.A))
+    saved = board.copy()
+    board.move_token(CENTER_HEX, ADJACENT_HEX)
+    board.set_control(ADJACENT_HEX, Control.B)
+
+    board.restore(saved)
+    assert board.get_token_at(ADJACENT_HEX) is None
+    assert board.control_of(ADJACENT_HEX) is Control.NEUTRAL
+    assert len(board) == len(saved)
+
+    with pytest.raises(ValueError):
+        board.restore(Board(layout=CUSTOM_LAYOUT))
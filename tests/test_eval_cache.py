@@ -0,0 +1,134 @@
+"""Tests for the evaluation cache and canonical position keys."""
+
+import pytest
+from warchest.core import eval_cache
+from warchest.core.board import AStartingLocations, BStartingLocations, Board, Control
+from warchest.core.eval_cache import (
+    ENTRY_BYTES,
+    EvalCache,
+    canonical_key,
+    configure_shared_cache,
+    position_key,
+    shared_cache,
+)
+from warchest.core.enums import Player, TokenType
+from warchest.core.hex import Hex
+from warchest.core.tokens import Token
+
+A_HEX = Hex(3, 1)
+B_HEX = Hex(-3, -1)
+
+
+def material(board):
+    """Zero-sum toy evaluation: A tokens minus B tokens, weighted by q."""
+    score = 0.0
+    for hx, cell in board:
+        for tk in cell.stack:
+            score += (1 + hx.q) if tk.owner is Player.A else -(1 - hx.q)
+    return score
+
+
+def test_starting_locations_are_mirrors():
+    """Verify the starting locations map onto each other under rotation."""
+    assert {Hex(-hx.q, -hx.r) for hx in AStartingLocations} == set(BStartingLocations)
+
+
+def test_position_key_ignores_token_ids():
+    """Verify equivalent positions with different token ids share a key."""
+    b1 = Board(initial={A_HEX: Token.create(TokenType.BLANK, Player.A)})
+    b2 = Board(initial={A_HEX: Token.create(TokenType.BLANK, Player.A)})
+    assert position_key(b1) == position_key(b2)
+
+
+def test_canonical_key_folds_mirror():
+    """Verify a position and its player-swapped mirror share a canonical key."""
+    board = Board(
+        initial={A_HEX: Token.create(TokenType.BLANK, Player.A)},
+        control={Hex(1, 0): Control.A},
+    )
+    mirror = Board(
+        initial={B_HEX: Token.create(TokenType.BLANK, Player.B)},
+        control={Hex(-1, 0): Control.B},
+    )
+    key1, flipped1 = canonical_key(board)
+    key2, flipped2 = canonical_key(mirror)
+    assert key1 == key2
+    assert flipped1 != flipped2
+
+
+def test_canonical_key_asymmetric_layout_never_flips():
+    """Verify boards on a non-symmetric layout are keyed as-is."""
+    layout = frozenset({Hex(0, 0), Hex(1, 1)})
+    board = Board(layout=layout, initial={Hex(1, 1): Token.create(TokenType.BLANK, Player.B)})
+    assert canonical_key(board) == (position_key(board), False)
+
+
+def test_cache_hit_on_mirror_negates_value():
+    """Verify a mirror lookup hits and returns the negated value."""
+    cache = EvalCache(8 * ENTRY_BYTES)
+    board = Board(initial={A_HEX: Token.create(TokenType.BLANK, Player.A)})
+    mirror = Board(initial={B_HEX: Token.create(TokenType.BLANK, Player.B)})
+
+    value = cache.get_or_compute(board, material)
+    assert value == material(board)
+    assert cache.get_or_compute(mirror, pytest.fail) == material(mirror) == -value
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_lru_eviction():
+    """Verify the least recently used entry is evicted first."""
+    cache = EvalCache(2 * ENTRY_BYTES, symmetric=False)
+    boards = [Board(initial={Hex(q, 0): Token.create(TokenType.BLANK, Player.A)}) for q in range(3)]
+    cache.put(boards[0], 0.0)
+    cache.put(boards[1], 1.0)
+    assert cache.get(boards[0]) == 0.0  # refresh boards[0]
+    cache.put(boards[2], 2.0)
+
+    assert boards[0] in cache
+    assert boards[1] not in cache
+    assert cache.get(boards[1]) is None
+    assert cache.stats().evictions == 1
+    assert len(cache) == 2
+
+
+def test_cache_bound_in_bytes():
+    """Verify entries are fixed-size digests and the byte bound is reported."""
+    cache = EvalCache(10 * ENTRY_BYTES + ENTRY_BYTES // 2)
+    board = Board(initial={A_HEX: Token.create(TokenType.BLANK, Player.A)})
+    cache.put(board, 1.0)
+
+    key, _ = cache.key_for(board)
+    assert isinstance(key, int) and 0 <= key < 1 << 64
+    stats = cache.stats()
+    assert stats.max_entries == 10
+    assert (stats.bytes, stats.max_bytes) == (ENTRY_BYTES, cache.max_bytes)
+
+
+def test_cache_rejects_bad_bound():
+    """Verify a bound too small for one entry raises ValueError."""
+    with pytest.raises(ValueError):
+        EvalCache(0)
+    with pytest.raises(ValueError):
+        EvalCache(ENTRY_BYTES - 1)
+
+
+def test_shared_cache_is_singleton():
+    """Verify the process-wide cache is reused."""
+    assert shared_cache() is shared_cache()
+
+
+def test_configure_shared_cache(monkeypatch):
+    """Verify the shared cache takes its settings once and rejects conflicting ones."""
+    monkeypatch.setattr(eval_cache, "_SHARED", None)
+    cache = configure_shared_cache(1 << 20, symmetric=False)
+    assert shared_cache() is cache
+    assert (cache.max_bytes, cache.symmetric) == (1 << 20, False)
+    assert configure_shared_cache(1 << 20, symmetric=False) is cache
+
+    with pytest.raises(ValueError):
+        configure_shared_cache(2 << 20, symmetric=False)
+    with pytest.raises(ValueError):
+        configure_shared_cache(1 << 20)
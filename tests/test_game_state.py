@@ -0,0 +1,297 @@
+"""Tests for the GameState turn rules."""
+
+import random
+import pytest
+from warchest.agents import RandomAgent
+from warchest.core.action import Action, MoveAction, PassAction
+from warchest.core.board import Board
+from warchest.core.enums import ActionStatus, Control, LocationType, Player, TokenType
+from warchest.core.eval_cache import position_key
+from warchest.core.game_state import CONTROL_TO_WIN, GameState, apply_batch
+from warchest.core.hex import Hex
+from warchest.core.tokens import Token
+
+
+def hand_token(owner):
+    """Create a token that MoveAction accepts as movable."""
+    token = Token.create(TokenType.BLANK, owner)
+    return Token(token.id, token.token_type, owner, LocationType.HAND)
+
+
+def test_initial_state():
+    """Verify the default setup: one unit per on-board starting location."""
+    gs = GameState()
+    assert gs.get_current_player() is Player.A
+    assert gs.board.get_token_at(Hex(3, 1)).owner is Player.A
+    assert gs.board.get_token_at(Hex(-3, -1)).owner is Player.B
+    assert gs.controlled_by(Player.A) == gs.controlled_by(Player.B) == 1
+    assert not gs.is_over()
+
+
+def test_legal_actions_are_valid_and_ordered():
+    """Verify legal actions are valid moves in dense-index order."""
+    gs = GameState(starting_player=Player.B)
+    actions = gs.legal_actions()
+    assert actions
+    assert all(isinstance(a, MoveAction) and a.is_valid(gs) for a in actions)
+    index = gs.board.index.index
+    froms = [index[a.from_hex] for a in actions]
+    assert froms == sorted(froms)
+
+
+def test_pass_when_blocked():
+    """Verify a player with no moves can only pass."""
+    layout = frozenset({Hex(0, 0), Hex(1, 0)})
+    board = Board(layout=layout, initial={Hex(0, 0): hand_token(Player.A)})
+    board.place(Hex(1, 0), hand_token(Player.B))
+    gs = GameState(board)
+    actions = gs.legal_actions()
+    assert len(actions) == 1 and isinstance(actions[0], PassAction)
+    gs.apply(actions[0])
+    assert gs.get_current_player() is Player.B
+    assert gs.turn == 1
+
+
+def test_apply_captures_control_and_switches_turn():
+    """Verify moving onto a control point takes control of it."""
+    gs = GameState()
+    unit = gs.board.get_token_at(Hex(3, 1))
+    gs.apply(MoveAction(Player.A, unit, Hex(3, 1), Hex(2, 1)))
+    assert gs.board.control_of(Hex(2, 1)) is Control.A
+    assert gs.get_current_player() is Player.B
+    assert gs.history[-1].to_hex == Hex(2, 1)
+
+
+def test_apply_rejects_invalid_action():
+    """Verify invalid actions raise ValueError and leave the state untouched."""
+    gs = GameState()
+    unit = gs.board.get_token_at(Hex(3, 1))
+    with pytest.raises(ValueError):
+        gs.apply(MoveAction(Player.B, unit, Hex(3, 1), Hex(2, 1)))
+    assert gs.turn == 0
+
+
+def test_win_and_turn_limit():
+    """Verify the game ends on enough control points or at the turn limit."""
+    board = Board(initial={Hex(1, 1): hand_token(Player.A)})
+    points = sorted(GameState.control_points(board), key=lambda hx: (hx.q, hx.r))
+    for hx in points[: CONTROL_TO_WIN - 1]:
+        if hx != Hex(2, 1):
+            board.set_control(hx, Control.A)
+    gs = GameState(board)
+    unit = board.get_token_at(Hex(1, 1))
+    gs.apply(MoveAction(Player.A, unit, Hex(1, 1), Hex(2, 1)))
+    assert gs.winner() is Player.A
+    assert gs.is_over()
+
+    gs = GameState(max_turns=2)
+    while not gs.is_over():
+        gs.apply(gs.legal_actions()[0])
+    assert gs.turn == 2 and gs.winner() is None
+
+
+def test_copy_is_independent():
+    """Verify copies do not share mutable state."""
+    gs = GameState()
+    clone = gs.copy()
+    clone.apply(clone.legal_actions()[0])
+    assert gs.turn == 0 and clone.turn == 1
+    assert gs.board.get_token_at(Hex(3, 1)) is not None
+
+
+def snapshot(gs):
+    """Everything apply/apply_batch may change."""
+    return position_key(gs.board), gs.turn, gs.get_current_player(), gs.winner(), len(gs.history)
+
+
+def mixed_actions(gs, rng, n, salt=0.2):
+    """Play n legal moves on a copy, salting the list with invalid actions."""
+    sim = gs.copy()
+    agent = RandomAgent(rng.getrandbits(32))
+    actions = []
+    for _ in range(n):
+        if sim.is_over():
+            break
+        action = agent.choose_action(sim)
+        if rng.random() < salt:
+            unit = sim.board.get_token_at(Hex(3, 1)) or hand_token(Player.A)
+            actions.append(
+                rng.choice(
+                    [
+                        MoveAction(sim.get_current_player(), unit, Hex(3, 1), Hex(0, 0)),
+                        MoveAction(sim.get_current_player(), unit, Hex(3, 1), Hex(4, 1)),
+                        PassAction(
+                            Player.A if sim.get_current_player() is Player.B else Player.B
+                        ),
+                    ]
+                )
+            )
+        actions.append(action)
+        sim.apply(action)
+    return actions
+
+
+def test_apply_batch_matches_sequential():
+    """Verify statuses and final state agree with is_valid + apply one at a time."""
+    rng = random.Random(11)
+    for _ in range(20):
+        start = GameState(max_turns=rng.choice([40, 200]))
+        actions = mixed_actions(start, rng, 60)
+        batched, single = start.copy(), start.copy()
+
+        statuses = apply_batch(batched, actions)
+        expected = []
+        for action in actions:
+            ok = not single.is_over() and action.is_valid(single)
+            if ok:
+                single.apply(action)
+            expected.append(ok)
+        assert [s is ActionStatus.OK for s in statuses] == expected
+        assert snapshot(batched) == snapshot(single)
+
+
+def test_apply_batch_status_codes():
+    """Verify each failure is reported with its own code."""
+    gs = GameState()
+    unit = gs.board.get_token_at(Hex(3, 1))
+    enemy = gs.board.get_token_at(Hex(-3, -1))
+    actions = [
+        MoveAction(Player.B, enemy, Hex(-3, -1), Hex(-2, -1)),
+        MoveAction(Player.A, enemy, Hex(3, 1), Hex(2, 1)),
+        MoveAction(Player.A, enemy, Hex(-3, -1), Hex(-2, -1)),
+        MoveAction(Player.A, unit, Hex(3, 1), Hex(1, 1)),
+        MoveAction(Player.A, unit, Hex(3, 1), Hex(4, 1)),
+        MoveAction(Player.A, unit, Hex(9, 9), Hex(9, 8)),
+        MoveAction(Player.A, unit, Hex(3, 1), Hex(2, 1)),
+    ]
+    assert apply_batch(gs, actions) == [
+        ActionStatus.WRONG_PLAYER,
+        ActionStatus.TOKEN_MISMATCH,
+        ActionStatus.NOT_MOVABLE,
+        ActionStatus.BAD_DISTANCE,
+        ActionStatus.OFF_BOARD,
+        ActionStatus.TOKEN_MISMATCH,
+        ActionStatus.OK,
+    ]
+    assert gs.get_current_player() is Player.B
+
+    over = GameState(max_turns=0)
+    assert apply_batch(over, [PassAction(Player.A)]) == [ActionStatus.GAME_OVER]
+
+
+def test_apply_batch_destination_occupied():
+    """Verify moving onto an occupied hex is rejected."""
+    gs = GameState()
+    unit = gs.board.get_token_at(Hex(3, 1))
+    gs.board.place(Hex(2, 1), hand_token(Player.B))
+    move = MoveAction(Player.A, unit, Hex(3, 1), Hex(2, 1))
+    assert apply_batch(gs, [move]) == [ActionStatus.DESTINATION_OCCUPIED]
+
+
+def test_apply_batch_transaction_rolls_back():
+    """Verify a failing transaction leaves the state exactly as it was."""
+    rng = random.Random(3)
+    start = GameState()
+    good = mixed_actions(start, rng, 30, salt=0)
+    before = snapshot(start)
+    field_before = start.board.distance_field([Hex(0, 0)])
+
+    bad = PassAction(Player.A if len(good) % 2 else Player.B)  # wrong player
+    actions = good + [bad, rng.choice(good)]
+    statuses = apply_batch(start, actions, transactional=True)
+    assert statuses == [ActionStatus.ROLLED_BACK] * len(good) + [
+        ActionStatus.WRONG_PLAYER,
+        ActionStatus.SKIPPED,
+    ]
+    assert snapshot(start) == before
+    assert start.board.distance_field([Hex(0, 0)]) == field_before
+
+    # a clean transaction commits everything
+    assert set(apply_batch(start, good, transactional=True)) == {ActionStatus.OK}
+    assert start.turn == len(good)
+
+
+class PlaceAction(Action):
+    """Action type without an apply_batch fast path: drop a token on an empty hex."""
+
+    def __init__(self, player, hx):
+        super().__init__(player, hx=hx)
+        self.hx = hx
+
+    def is_valid(self, game_state):
+        return super().is_valid(game_state) and game_state.board.get_token_at(self.hx) is None
+
+    def apply(self, game_state):
+        game_state.board.place(self.hx, hand_token(self.player))
+
+
+def test_apply_batch_rollback_restores_board_in_place():
+    """Verify rollback keeps the same Board object and leaves no extra cells behind."""
+    gs = GameState()
+    board = gs.board
+    cells_before = len(board)
+    before = snapshot(gs)
+    unit = board.get_token_at(Hex(3, 1))
+    actions = [
+        MoveAction(Player.A, unit, Hex(3, 1), Hex(2, 1)),
+        PlaceAction(Player.B, Hex(0, 0)),
+        PassAction(Player.B),  # wrong player: A is to move
+    ]
+    statuses = apply_batch(gs, actions, transactional=True)
+    assert statuses[-1] is ActionStatus.WRONG_PLAYER
+    assert gs.board is board
+    assert len(board) == cells_before
+    assert snapshot(gs) == before
+    assert board.get_token_at(Hex(0, 0)) is None
+
+
+class ExplodingAction(PlaceAction):
+    """PlaceAction whose apply raises after it has changed the board."""
+
+    def apply(self, game_state):
+        super().apply(game_state)
+        raise RuntimeError("boom")
+
+
+def test_apply_batch_rolls_back_when_an_action_raises():
+    """Verify a transaction is undone before an exception from an action propagates."""
+    gs = GameState()
+    board = gs.board
+    before = snapshot(gs)
+    unit = board.get_token_at(Hex(3, 1))
+    actions = [
+        MoveAction(Player.A, unit, Hex(3, 1), Hex(2, 1)),
+        ExplodingAction(Player.B, Hex(0, 0)),
+    ]
+    with pytest.raises(RuntimeError):
+        apply_batch(gs, actions, transactional=True)
+    assert gs.board is board
+    assert snapshot(gs) == before
+
+    # without a transaction the moves applied so far are kept and the turn is in sync
+    with pytest.raises(RuntimeError):
+        apply_batch(gs, actions)
+    assert (gs.turn, gs.get_current_player(), len(gs.history)) == (1, Player.B, 1)
+
+
+class CountingMove(MoveAction):
+    """MoveAction subclass that records how often its own validation runs."""
+
+    calls = 0
+
+    def is_valid(self, game_state):
+        CountingMove.calls += 1
+        return super().is_valid(game_state)
+
+
+def test_apply_batch_defers_to_move_subclasses():
+    """Verify MoveAction subclasses skip the fast path and still capture control."""
+    gs = GameState()
+    unit = gs.board.get_token_at(Hex(3, 1))
+    CountingMove.calls = 0
+    assert apply_batch(gs, [CountingMove(Player.A, unit, Hex(3, 1), Hex(2, 1))]) == [
+        ActionStatus.OK
+    ]
+    assert CountingMove.calls == 1
+    assert gs.board.control_of(Hex(2, 1)) is Control.A
+    assert gs.get_current_player() is Player.B
@@ -0,0 +1,64 @@
+"""Tests for the opening book builder and memory-mapped reader."""
+
+import pytest
+from warchest.agents import GreedyAgent, RandomAgent
+from warchest.core.enums import Player
+from warchest.core.game_state import GameState
+from warchest.opening_book import HEADER, RECORD, OpeningBook, build_book, position_hash
+from warchest.tournament import self_play
+
+
+@pytest.fixture(name="records")
+def fixture_records():
+    """A small deterministic self-play corpus."""
+    return list(self_play(GreedyAgent, RandomAgent, 40, seed=4, max_turns=80))
+
+
+def test_position_hash_ignores_token_ids_but_not_side_to_move():
+    """Verify the hash is stable across fresh tokens and depends on the mover."""
+    assert position_hash(GameState()) == position_hash(GameState())
+    assert position_hash(GameState()) != position_hash(GameState(starting_player=Player.B))
+
+
+def test_build_and_probe(records, tmp_path):
+    """Verify aggregated counts and lookups from the mapped file."""
+    path = str(tmp_path / "book.bin")
+    count = build_book(records, path, max_ply=4)
+    with open(path, "rb") as fh:
+        assert len(fh.read()) == HEADER.size + count * RECORD.size
+
+    with OpeningBook(path) as book:
+        assert len(book) == count and book.max_ply == 4
+        starts_a = [r for r in records if r.starting_player is Player.A]
+        moves = book.probe(starts_a[0].new_game())
+        assert sum(m.games for m in moves) == len(starts_a)
+        assert moves == sorted(moves, key=lambda m: (m.games, m.score), reverse=True)
+        played = {((m.from_hex.q, m.from_hex.r), (m.to_hex.q, m.to_hex.r)) for m in moves}
+        assert {r.moves[0] for r in starts_a} == played
+
+        # positions past max_ply are not in the book
+        for ply, (state, _) in enumerate(starts_a[0].replay()):
+            if ply == 4:
+                assert book.probe(state) == []
+                break
+
+
+def test_min_games_filters(records, tmp_path):
+    """Verify rarely played moves are dropped."""
+    all_path, common_path = str(tmp_path / "all.bin"), str(tmp_path / "common.bin")
+    assert build_book(records, common_path, max_ply=6, min_games=3) < build_book(
+        records, all_path, max_ply=6
+    )
+    with OpeningBook(common_path) as book:
+        assert all(m.games >= 3 for m in book.probe(GameState()))
+
+
+def test_rejects_bad_files(tmp_path):
+    """Verify non-book files raise ValueError."""
+    path = tmp_path / "junk.bin"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        OpeningBook(str(path))
+    path.write_bytes(b"x" * (HEADER.size + RECORD.size))
+    with pytest.raises(ValueError):
+        OpeningBook(str(path))
@@ -0,0 +1,97 @@
+"""Tests for the flat playout kernel: it must replay the object-based games exactly."""
+
+import random
+import pytest
+from warchest.agents import GreedyAgent, RandomAgent
+from warchest.core.board import Board
+from warchest.core.enums import LocationType, Player, TokenType
+from warchest.core.game_state import GameState
+from warchest.core.hex import Hex
+from warchest.core.playout import (
+    BLOCKED,
+    EMPTY,
+    FlatState,
+    PlayoutBuffer,
+    Policy,
+    playout,
+    playout_game,
+)
+from warchest.core.tokens import Token
+
+AGENTS = {Policy.RANDOM: RandomAgent, Policy.GREEDY: GreedyAgent}
+
+
+def play_objects(gs, seed, policy):
+    """Reference path: one shared agent plays both sides through GameState."""
+    agent = AGENTS[policy](seed)
+    while not gs.is_over():
+        gs.apply(agent.choose_action(gs))
+    return gs
+
+
+def assert_same_position(gs, buf):
+    """Compare the final GameState with the kernel's buffer."""
+    for i, hx in enumerate(gs.board.index.hexes):
+        token = gs.board.get_token_at(hx)
+        assert buf.tid[i] == (-1 if token is None else token.id)
+        assert buf.control(i) is gs.board.control_of(hx)
+    assert buf.turn == gs.turn
+
+
+@pytest.mark.parametrize("policy", list(Policy))
+@pytest.mark.parametrize("starting", [Player.A, Player.B])
+def test_playout_matches_object_path(policy, starting):
+    """Verify kernel playouts end exactly where the object-based path does."""
+    start = GameState(starting_player=starting)
+    state = FlatState.from_game(start)
+    buf = PlayoutBuffer.for_state(state)
+    for seed in range(25):
+        winner = playout(state, random.Random(seed), buf, policy)
+        reference = play_objects(start.copy(), seed, policy)
+        expected = reference.winner()
+        assert winner == (EMPTY if expected is None else expected.value)
+        assert_same_position(reference, buf)
+
+
+def test_playout_from_midgame_with_blockers():
+    """Verify equivalence from a custom position with immovable tokens and passes."""
+    board = GameState.initial_board()
+    board.place(Hex(0, 0), Token.create(TokenType.BLANK, Player.A))  # RESERVE: cannot move
+    unit = Token.create(TokenType.BLANK, Player.B)
+    board.place(Hex(1, 1), Token(unit.id, unit.token_type, Player.B, LocationType.HAND))
+    start = GameState(board, starting_player=Player.B, max_turns=120)
+    start.apply(start.legal_actions()[0])
+
+    state = FlatState.from_game(start)
+    assert state.occ[board.index.index[Hex(0, 0)]] == BLOCKED
+    buf = PlayoutBuffer.for_state(state)
+    for seed in range(10):
+        playout(state, random.Random(seed), buf, Policy.GREEDY)
+        assert_same_position(play_objects(start.copy(), seed, Policy.GREEDY), buf)
+
+
+def test_playout_with_only_passes():
+    """Verify a position with no legal moves runs to the turn limit."""
+    layout = frozenset({Hex(0, 0), Hex(1, 0)})
+    board = Board(layout=layout)
+    for hx, owner in ((Hex(0, 0), Player.A), (Hex(1, 0), Player.B)):
+        token = Token.create(TokenType.BLANK, owner)
+        board.place(hx, Token(token.id, token.token_type, owner, LocationType.HAND))
+    assert playout_game(GameState(board, max_turns=7), seed=1) is None
+
+
+def test_playout_leaves_state_untouched():
+    """Verify the input FlatState is not modified."""
+    state = FlatState.from_game(GameState())
+    before = (bytes(state.occ), state.tid.tobytes(), bytes(state.ctrl))
+    playout(state, random.Random(0), PlayoutBuffer.for_state(state))
+    assert (bytes(state.occ), state.tid.tobytes(), bytes(state.ctrl)) == before
+
+
+def test_playout_rejects_mismatched_buffer():
+    """Verify a buffer sized for another layout raises ValueError instead of being resized."""
+    state = FlatState.from_game(GameState())
+    buf = PlayoutBuffer(len(state.occ) - 1)
+    with pytest.raises(ValueError):
+        playout(state, random.Random(0), buf)
+    assert len(buf.occ) == len(state.occ) - 1
@@ -0,0 +1,46 @@
+"""Tests for game records."""
+
+from warchest.agents import RandomAgent
+from warchest.core.enums import ActionStatus, Player
+from warchest.core.game_state import apply_batch
+from warchest.core.records import GameRecord, read_records, write_records
+from warchest.tournament import self_play
+
+
+def test_record_roundtrip_and_replay(tmp_path):
+    """Verify records survive JSON and replay to the recorded result."""
+    records = list(self_play(RandomAgent, RandomAgent, 4, seed=2, max_turns=60))
+    assert [r.starting_player for r in records] == [Player.A, Player.B] * 2
+
+    path = str(tmp_path / "games.jsonl")
+    write_records(path, records)
+    loaded = list(read_records(path))
+    assert loaded == records
+
+    for record in loaded:
+        plies = 0
+        for gs, action in record.replay():
+            assert action.is_valid(gs)
+            plies += 1
+        assert plies == len(record.moves)
+        assert gs.winner() == record.winner
+
+
+def test_record_from_game_with_pass():
+    """Verify passes are stored as None."""
+    record = GameRecord.from_json('{"start": "B", "moves": [null], "winner": null}')
+    assert record.moves == [None] and record.starting_player is Player.B
+    assert GameRecord.from_json(record.to_json()) == record
+
+
+def test_record_actions_verify_with_apply_batch():
+    """Verify recorded games check out in one batch and tampered ones do not."""
+    for record in self_play(RandomAgent, RandomAgent, 3, seed=8, max_turns=50):
+        gs = record.new_game()
+        assert set(apply_batch(gs, record.actions(gs))) == {ActionStatus.OK}
+        assert gs.winner() == record.winner
+
+        record.moves[1] = record.moves[0]  # replay the opening move out of turn
+        gs = record.new_game()
+        statuses = apply_batch(gs, record.actions(gs), transactional=True)
+        assert statuses[1] is not ActionStatus.OK and gs.turn == 0
@@ -0,0 +1,192 @@
+"""Tests for the tournament runner and its statistics."""
+
+import json
+import math
+import pytest
+from warchest.agents import GreedyAgent, RandomAgent
+from warchest.core.enums import Player
+from warchest.tournament import (
+    PairRecord,
+    SPRTConfig,
+    Tournament,
+    bradley_terry,
+    elo_interval,
+    elo_to_score,
+    play_game,
+    score_to_elo,
+    sprt_llr,
+    _play_scheduled,
+)
+
+ENTRANTS = [("random", RandomAgent), ("greedy", GreedyAgent)]
+
+
+def test_elo_score_roundtrip():
+    """Verify Elo <-> expected score conversions are inverse."""
+    assert elo_to_score(0) == 0.5
+    for elo in (-300.0, -20.0, 0.0, 55.0, 400.0):
+        assert score_to_elo(elo_to_score(elo)) == pytest.approx(elo)
+
+
+def test_elo_interval_contains_estimate():
+    """Verify the interval brackets the point estimate and shrinks with games."""
+    elo, low, high = elo_interval(60, 20, 20)
+    assert low < elo < high
+    _, low2, high2 = elo_interval(600, 200, 200)
+    assert high2 - low2 < high - low
+    assert elo_interval(0, 0, 0) == (0.0, -math.inf, math.inf)
+
+
+def test_sprt_llr_sign():
+    """Verify the LLR favours H1 for a strong record and H0 for an even one."""
+    assert sprt_llr(80, 10, 10, 0, 50) > 0
+    assert sprt_llr(45, 10, 45, 0, 50) < 0
+
+
+def test_pair_record_decisions():
+    """Verify SPRT decisions for lopsided, even and capped pairings."""
+    sprt = SPRTConfig(max_games=1000)
+    strong = PairRecord("x", "y", wins=40, draws=5, losses=5)
+    strong.update_decision(sprt)
+    assert strong.decision == "x"
+
+    even = PairRecord("x", "y", wins=400, draws=100, losses=400)
+    even.update_decision(sprt)
+    assert even.decision == "equal"
+
+    capped = PairRecord("x", "y", wins=6, draws=0, losses=4)
+    capped.update_decision(SPRTConfig(max_games=10))
+    assert capped.decision == "max_games"
+
+
+def test_sprt_decides_zero_variance_records_early():
+    """Verify a clean sweep and an all-draw record are decided, not run to max_games."""
+    sprt = SPRTConfig()
+    sweeps = [PairRecord("x", "y", wins=n) for n in range(1, 50)]
+    for pair in sweeps:
+        pair.update_decision(sprt)
+    decided = [pair.games for pair in sweeps if pair.decision == "x"]
+    assert decided and decided[0] < 20
+
+    draws = PairRecord("x", "y", draws=300)
+    draws.update_decision(sprt)
+    assert draws.decision == "equal"
+
+    swept = PairRecord("y", "x", losses=500)
+    swept.update_decision(sprt)
+    assert swept.decision == "x"
+
+
+def test_elo_interval_has_width_for_sweeps():
+    """Verify a sweep gets a finite, non-degenerate interval."""
+    elo, low, high = elo_interval(500, 0, 0)
+    assert low < elo
+    assert low > 0
+    elo, low, high = elo_interval(0, 300, 0)
+    assert low < elo == 0.0 < high
+
+
+def test_bradley_terry_weights_pairings_by_evidence():
+    """Verify unequal pairing lengths do not reorder the field as pooled W/D/L would."""
+    pairs = [
+        PairRecord("X", "Y", wins=12),
+        PairRecord("X", "Z", wins=520, losses=480),
+        PairRecord("Y", "Z", wins=500, losses=500),
+    ]
+    ratings = bradley_terry(["X", "Y", "Z"], pairs)
+    assert [r.name for r in ratings] == ["X", "Z", "Y"]
+    assert [r.games for r in ratings] == [1012, 2000, 1012]
+    assert sum(r.elo for r in ratings) == pytest.approx(0.0, abs=1e-6)
+    assert all(r.low < r.elo < r.high for r in ratings)
+
+
+def test_bradley_terry_two_entrants():
+    """Verify a single pairing splits its Elo difference evenly and unplayed entrants are unbounded."""
+    x, y = bradley_terry(["X", "Y"], [PairRecord("X", "Y", 60, 20, 20)])
+    assert x.name == "X" and x.elo == pytest.approx(-y.elo)
+    assert x.elo - y.elo == pytest.approx(score_to_elo((60 + 10 + 0.5) / 101))
+    (r, _) = bradley_terry(["X", "Y"], [PairRecord("X", "Y")])
+    assert (r.elo, r.low, r.high, r.games) == (0.0, -math.inf, math.inf, 0)
+
+
+def test_play_game_is_deterministic():
+    """Verify seeded agents replay the same game."""
+    results = {
+        play_game(RandomAgent(s), GreedyAgent(s + 1), starting_player=Player.B) for s in [3, 3]
+    }
+    assert len(results) == 1
+
+
+def test_tournament_stops_early():
+    """Verify a lopsided pairing is decided well before max_games."""
+    tour = Tournament(ENTRANTS, sprt=SPRTConfig(max_games=200), seed=1)
+    (pair,) = tour.run()
+    assert pair.decision == "greedy"
+    assert pair.games < 200
+    ratings = tour.ratings()
+    assert ratings[0].name == "greedy"
+    assert ratings[0].low < ratings[0].elo == pytest.approx(-ratings[1].elo)
+    # per-entrant intervals are anchored to the field mean; the pairing's own
+    # interval (random's Elo relative to greedy) must exclude zero
+    assert pair.elo()[2] < 0
+    assert "greedy" in tour.report()
+
+
+def test_tournament_checkpoint_resume(tmp_path):
+    """Verify an interrupted run resumes from its checkpoint."""
+    path = str(tmp_path / "ckpt.json")
+    first = Tournament(ENTRANTS, sprt=SPRTConfig(max_games=4), checkpoint=path, seed=5)
+    first.run()
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert data["pairs"][0]["scheduled"] == 4
+
+    # pretend the run was cut short and raise the game cap
+    data["pairs"][0]["decision"] = None
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+    resumed = Tournament(ENTRANTS, sprt=SPRTConfig(max_games=6), checkpoint=path, seed=99)
+    assert resumed.seed == 5
+    (pair,) = resumed.run()
+    assert pair.scheduled >= 5
+    assert pair.games == pair.scheduled
+
+    with pytest.raises(ValueError):
+        Tournament([("a", RandomAgent), ("b", RandomAgent)], checkpoint=path)
+
+
+def test_tournament_resume_replays_lost_games(tmp_path):
+    """Verify games in flight at an interruption are replayed with the same numbers."""
+    sprt = SPRTConfig(max_games=6)
+    reference = Tournament(ENTRANTS, sprt=sprt, seed=7)
+    (expected,) = reference.run()
+
+    path = str(tmp_path / "ckpt.json")
+    crashed = Tournament(ENTRANTS, sprt=sprt, checkpoint=path, seed=7)
+    jobs = crashed._next_jobs()
+    started = [next(jobs) for _ in range(4)]
+    pair, game = started[1]  # only game 1 finishes before the crash
+    crashed._record(pair, game, _play_scheduled(*crashed._job_args(pair, game)))
+    crashed._save()
+
+    resumed = Tournament(ENTRANTS, sprt=sprt, checkpoint=path)
+    (pair,) = resumed.run()
+    assert pair.in_flight == []
+    assert pair.scheduled == pair.games == 6
+    assert (pair.wins, pair.draws, pair.losses) == (expected.wins, expected.draws, expected.losses)
+
+
+def test_tournament_process_pool():
+    """Verify games can be played across worker processes."""
+    tour = Tournament(ENTRANTS, sprt=SPRTConfig(max_games=6), workers=2)
+    (pair,) = tour.run()
+    assert pair.games == pair.scheduled > 0
+    assert pair.decision is not None
+
+
+def test_tournament_rejects_bad_entrants():
+    """Verify entrant lists are checked."""
+    with pytest.raises(ValueError):
+        Tournament([("a", RandomAgent)])
+    with pytest.raises(ValueError):
+        Tournament([("a", RandomAgent), ("a", GreedyAgent)])